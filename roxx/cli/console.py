@@ -569,6 +569,22 @@ def _view_cert_details(certs_dir: Path):
     input("\nPress Enter to continue...")
 
 
+def _tail_lines(path: Path, count: int = 50, block_size: int = 65536) -> list:
+    """Return the last `count` lines of a file, reading 64 KiB blocks from the end"""
+    with open(path, 'rb') as f:
+        end = f.seek(0, 2)
+        pos = end
+        data = b""
+        # One extra newline is needed to know the first kept line is complete
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    lines = data.decode('utf-8', errors='replace').splitlines(keepends=True)
+    return lines[-count:]
+
+
 def view_logs():
     """View System Logs"""
     show_header()
@@ -597,10 +613,7 @@ def view_logs():
     path = log_dir / log_file
     
     try:
-        # Read last 50 lines
-        with open(path, 'r', encoding='utf-8', errors='replace') as f:
-             lines = f.readlines()
-             last_lines = lines[-50:]
+        last_lines = _tail_lines(path, 50)
         
         console.clear()
         console.print(Panel("".join(last_lines), title=f"Log Viewer: {log_file} (Last 50 lines)", border_style="blue"))
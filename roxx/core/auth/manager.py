@@ -2,12 +2,20 @@ import logging
 import sqlite3
 import re
 import secrets
+import base64
 import bcrypt
 from datetime import datetime
+from urllib.parse import quote
 from roxx.core.auth.db import AdminDatabase
+from roxx.core.auth.verify_cache import verify_cache
 
 logger = logging.getLogger("roxx.auth")
 
+# otpauth:// pieces that never change; only the label and secret vary
+_TOTP_ISSUER = "RoXX"
+_TOTP_URI_PREFIX = f"otpauth://totp/{quote(_TOTP_ISSUER)}:"
+_TOTP_URI_SUFFIX = f"&issuer={quote(_TOTP_ISSUER)}"
+
 class AuthManager:
     """
     Handles Admin Authentication, Password Hashing, and User Management.
@@ -74,7 +82,7 @@ class AuthManager:
             try:
                 stored_hash = user["password_hash"].encode('utf-8')
                 password_bytes = password.encode('utf-8')
-                if not bcrypt.checkpw(password_bytes, stored_hash):
+                if not verify_cache.check(stored_hash, password_bytes, bcrypt.checkpw):
                     logger.warning(f"Password mismatch for {username}")
                     return False, None
             except Exception as e:
@@ -249,13 +257,13 @@ class AuthManager:
         """
         # Generate random 160-bit (20 bytes) secret encoded as Base32
         # Standard: 16 bytes = 128 bit minimal, 20 bytes = 160 bits (recommended)
-        import base64
         secret_bytes = secrets.token_bytes(20)
         secret_base32 = base64.b32encode(secret_bytes).decode('utf-8').strip('=')
         
         # Provisioning URI for QR Code
         # otpauth://totp/RoXX:admin?secret=...&issuer=RoXX
-        provisioning_uri = f"otpauth://totp/RoXX:{username}?secret={secret_base32}&issuer=RoXX"
+        # The username is percent-encoded so '@', '?', '&', ':' etc. can't break the URI
+        provisioning_uri = f"{_TOTP_URI_PREFIX}{quote(username, safe='')}?secret={secret_base32}{_TOTP_URI_SUFFIX}"
         return secret_base32, provisioning_uri
 
     @staticmethod
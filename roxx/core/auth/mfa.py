@@ -7,7 +7,6 @@ import pyotp
 import qrcode
 import secrets
 import hashlib
-import io
 import base64
 from datetime import datetime
 from typing import Tuple, List, Optional
@@ -49,25 +48,55 @@ class MFAManager:
             totp_uri: TOTP URI from generate_totp_uri()
             
         Returns:
-            Base64 encoded PNG image data URL
+            Base64 encoded SVG image data URL
+        """
+        svg = MFAManager.render_qr_svg(totp_uri)
+        return f"data:image/svg+xml;base64,{base64.b64encode(svg.encode()).decode()}"
+
+    @staticmethod
+    def render_qr_svg(totp_uri: str, box_size: int = 6) -> str:
+        """
+        Render a QR code as a standalone SVG document
+        
+        The module matrix is turned straight into one <path> of horizontal
+        runs, so no PIL image is drawn and no PNG is encoded.
+        
+        Args:
+            totp_uri: TOTP URI from generate_totp_uri()
+            box_size: Displayed pixels per QR module
+            
+        Returns:
+            SVG markup
         """
         qr = qrcode.QRCode(
             version=1,
             error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
             border=4,
         )
         qr.add_data(totp_uri)
         qr.make(fit=True)
+        matrix = qr.get_matrix()
         
-        img = qr.make_image(fill_color="black", back_color="white")
-        
-        # Convert to base64 data URL
-        buffer = io.BytesIO()
-        img.save(buffer, format='PNG')
-        img_base64 = base64.b64encode(buffer.getvalue()).decode()
+        runs = []
+        for y, row in enumerate(matrix):
+            x, width = 0, len(row)
+            while x < width:
+                if not row[x]:
+                    x += 1
+                    continue
+                start = x
+                while x < width and row[x]:
+                    x += 1
+                runs.append(f"M{start} {y}h{x - start}v1h-{x - start}z")
         
-        return f"data:image/png;base64,{img_base64}"
+        size = len(matrix)
+        pixels = size * box_size
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{pixels}" height="{pixels}" '
+            f'viewBox="0 0 {size} {size}" shape-rendering="crispEdges">'
+            f'<rect width="{size}" height="{size}" fill="#fff"/>'
+            f'<path d="{"".join(runs)}"/></svg>'
+        )
     
     @staticmethod
     def verify_totp(secret: str, token: str, valid_window: int = 1) -> bool:
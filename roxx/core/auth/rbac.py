@@ -98,37 +98,30 @@ def _resolve_role(username: str) -> str:
 def get_auth_context(request: Request) -> Optional[dict]:
     """
     Return the authenticated session context from the signed Starlette session.
-    Legacy unsigned cookies are migrated lazily, but role is always resolved
-    server-side from the database.
+    The session cookie is HMAC-signed (itsdangerous), so verifying it is the
+    only check needed; role is always resolved server-side from the database.
+    Legacy unsigned base64 "session" cookies are ignored.
+
+    Route dependencies and page helpers call this several times per request,
+    so the resolved context is kept in request.state for as long as the
+    session still holds the same auth entry.
     """
     auth = request.session.get("auth")
-    if isinstance(auth, dict):
-        username = auth.get("username")
-        status = auth.get("status")
-        if username and status:
-            role = _resolve_role(username) if status == "active" else auth.get("role")
-            return {"username": username, "status": status, "role": role}
-
-    session_cookie = request.cookies.get("session")
-    if not session_cookie:
+    if not isinstance(auth, dict):
         return None
 
-    try:
-        import base64
-
-        decoded = base64.b64decode(session_cookie).decode("utf-8")
-        parts = decoded.split(":")
-        if len(parts) < 2:
-            return None
-
-        username = parts[0]
-        status = parts[1]
-        role = _resolve_role(username) if status == "active" else None
-        auth = {"username": username, "status": status, "role": role}
-        request.session["auth"] = auth
-        return auth
-    except Exception:
-        return None
+    cached = getattr(request.state, "auth_context", None)
+    if cached is not None and cached[0] is auth:
+        return cached[1]
+
+    username = auth.get("username")
+    status = auth.get("status")
+    if username and status:
+        role = _resolve_role(username) if status == "active" else auth.get("role")
+        context = {"username": username, "status": status, "role": role}
+        request.state.auth_context = (auth, context)
+        return context
+    return None
 
 
 def set_auth_context(request: Request, username: str, status: str) -> dict:
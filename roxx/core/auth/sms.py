@@ -76,7 +76,7 @@ class SMSProvider:
         headers = config.get("generic_headers", {})
         if isinstance(headers, str):
             try: headers = json.loads(headers)
-            except: pass
+            except ValueError: pass
             
         body_template = config.get("generic_body_template", "{}")
         
@@ -7,10 +7,22 @@ import os
 import sys
 import hmac
 import hashlib
+import secrets
 import struct
+import threading
 import time
 import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import FrozenSet, Optional, Tuple
+
+
+# Valid codes per (secret, digits, period, algorithm, window), for the latest counter only.
+# Repeated verifications inside one period become a set lookup instead of 2*window+1 HMACs.
+# Secrets are keyed by an HMAC under a per-process key so none are kept in plaintext.
+_WINDOW_CACHE_SIZE = 1024
+_WINDOW_CACHE_KEY = secrets.token_bytes(32)
+_window_cache: "OrderedDict[tuple, Tuple[int, FrozenSet[str]]]" = OrderedDict()
+_window_cache_lock = threading.Lock()
 
 
 class TOTPAuthenticator:
@@ -109,14 +121,35 @@ class TOTPAuthenticator:
         if timestamp is None:
             timestamp = int(time.time())
         
+        # A code of the wrong length can never match: skip the HMACs
+        if not code or len(code) != self.digits:
+            self.logger.warning("TOTP code verification failed")
+            return False
+        
         # Check current code and codes in tolerance window
-        for offset in range(-window, window + 1):
-            check_timestamp = timestamp + (offset * self.period)
-            expected_code = self.generate(check_timestamp)
-            
-            if code == expected_code:
-                self.logger.info(f"TOTP code verified (offset: {offset})")
-                return True
+        counter = self._get_counter(timestamp)
+        secret_digest = hmac.new(_WINDOW_CACHE_KEY, self.secret.encode(), hashlib.sha256).digest()
+        key = (secret_digest, self.digits, self.period, self.hash_algorithm, window)
+        valid_codes = None
+        with _window_cache_lock:
+            cached = _window_cache.get(key)
+            if cached is not None and cached[0] == counter:
+                _window_cache.move_to_end(key)
+                valid_codes = cached[1]
+        if valid_codes is None:
+            valid_codes = frozenset(
+                self.generate((counter + offset) * self.period)
+                for offset in range(-window, window + 1)
+            )
+            with _window_cache_lock:
+                _window_cache[key] = (counter, valid_codes)
+                _window_cache.move_to_end(key)
+                while len(_window_cache) > _WINDOW_CACHE_SIZE:
+                    _window_cache.popitem(last=False)
+        
+        if code in valid_codes:
+            self.logger.info("TOTP code verified")
+            return True
         
         self.logger.warning("TOTP code verification failed")
         return False
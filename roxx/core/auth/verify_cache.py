@@ -0,0 +1,60 @@
+"""
+Short-lived cache of password hash checks
+
+bcrypt is deliberately slow, so repeated logins with the same credentials
+would otherwise pay the full KDF cost every time. Entries are keyed by an
+HMAC of the stored hash and the candidate password under a per-process
+secret, so no plaintext is kept and a password change (new stored hash)
+never hits an old entry.
+"""
+
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+_SECRET = secrets.token_bytes(32)
+
+
+class VerifyCache:
+    """Bounded LRU of (stored_hash, password) -> bool results with a TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 120.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, tuple[bool, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(stored_hash: bytes, password: bytes) -> bytes:
+        return hmac.new(_SECRET, stored_hash + b"\x00" + password, hashlib.sha256).digest()
+
+    def check(self, stored_hash: bytes, password: bytes, verify: Callable[[bytes, bytes], bool]) -> bool:
+        """Return the cached verdict, or run verify() and remember it."""
+        key = self._key(stored_hash, password)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                return entry[0]
+
+        # Run the KDF outside the lock so concurrent logins stay parallel
+        result = bool(verify(password, stored_hash))
+
+        with self._lock:
+            self._entries[key] = (result, now + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+verify_cache = VerifyCache()
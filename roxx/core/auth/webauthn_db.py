@@ -69,7 +69,7 @@ class WebAuthnDatabase:
                 if c['transports']:
                    try:
                        c['transports'] = json.loads(c['transports'])
-                   except:
+                   except ValueError:
                        c['transports'] = []
                 creds.append(c)
             return creds
@@ -41,7 +41,7 @@ class HealthManager:
         # We can't actually 'ping' 1812 UDP with a TCP check easily, 
         # but we can check the process status via SystemManager.
         from roxx.utils.system import SystemManager
-        radius_active = SystemManager.is_service_running('freeradius') or SystemManager.is_service_running('radiusd')
+        radius_active = SystemManager.is_service_running('freeradius', 'radiusd')
         results["Radius"] = "UP" if radius_active else "DOWN"
         
         return results
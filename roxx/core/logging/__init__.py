@@ -5,5 +5,6 @@ Provides centralized logging for debugging authentication flows.
 """
 
 from .auth_log_buffer import AuthLogBuffer, auth_provider_logs, radius_backend_logs
+from .broadcast import LogBroadcaster, log_broadcaster
 
-__all__ = ['AuthLogBuffer', 'auth_provider_logs', 'radius_backend_logs']
+__all__ = ['AuthLogBuffer', 'auth_provider_logs', 'radius_backend_logs', 'LogBroadcaster', 'log_broadcaster']
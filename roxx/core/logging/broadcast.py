@@ -0,0 +1,116 @@
+"""
+Log Broadcaster
+
+Single producer, many consumers: one logging.Handler formats each record
+once and fans the line out to a bounded asyncio.Queue per subscriber
+(e.g. each /ws/logs WebSocket). Slow consumers drop their oldest lines
+instead of blocking the logger. The most recent lines are kept so a new
+subscriber starts with some context instead of an empty view.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from threading import Lock
+from typing import Dict, Tuple
+
+
+class LogBroadcaster(logging.Handler):
+    """
+    logging.Handler that fans records out to per-subscriber queues.
+
+    emit() may run on any thread; lines are handed to each subscriber's
+    event loop with call_soon_threadsafe. Subscribers are grouped per loop,
+    so a line costs one loop wake-up per worker loop, not one per client.
+    The grouping is copy-on-write: (un)subscribing rebuilds an immutable
+    snapshot under the lock and emit() iterates it without locking.
+    """
+
+    def __init__(self, level: int = logging.INFO, queue_size: int = 256, history: int = 200):
+        super().__init__(level)
+        self.queue_size = queue_size
+        # Formatted lines, so no record (args, traceback frames) outlives its log call
+        self._history: deque = deque(maxlen=min(history, queue_size))
+        self._subscribers: Dict[int, Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = {}
+        self._snapshot: Tuple[Tuple[asyncio.AbstractEventLoop, Tuple[asyncio.Queue, ...]], ...] = ()
+        self._lock = Lock()
+        self.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Register a new consumer on the running loop and return its queue,
+        pre-filled with the most recent lines.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        # emit() runs under the handler lock, so no record can land in both
+        # the replayed history and the live queue, or in neither
+        with self.lock, self._lock:
+            for line in self._history:
+                queue.put_nowait(line)
+            self._subscribers[id(queue)] = (asyncio.get_running_loop(), queue)
+            self._rebuild_snapshot()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a consumer registered with subscribe()"""
+        with self._lock:
+            if self._subscribers.pop(id(queue), None) is not None:
+                self._rebuild_snapshot()
+
+    def _rebuild_snapshot(self):
+        by_loop: Dict[asyncio.AbstractEventLoop, list] = {}
+        for loop, queue in self._subscribers.values():
+            by_loop.setdefault(loop, []).append(queue)
+        self._snapshot = tuple((loop, tuple(queues)) for loop, queues in by_loop.items())
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @staticmethod
+    async def next_batch(queue: asyncio.Queue, max_bytes: int = 64 * 1024) -> str:
+        """
+        Wait for a line, then take whatever else is already queued.
+
+        Lines are newline-joined (up to about max_bytes) so a burst goes
+        out as one WebSocket frame instead of one frame per line.
+        """
+        lines = [await queue.get()]
+        size = len(lines[0])
+        while size < max_bytes:
+            try:
+                line = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            lines.append(line)
+            size += len(line) + 1
+        return "\n".join(lines)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            line = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self._history.append(line)
+        subscribers = self._snapshot
+        if not subscribers:
+            return
+        for loop, queues in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queues, line)
+            except RuntimeError:
+                # Loop already closed; the subscriber is going away
+                pass
+
+
+def _offer(queues: Tuple[asyncio.Queue, ...], line: str):
+    for queue in queues:
+        if queue.full():
+            # A live view wants the newest lines: drop the oldest one
+            queue.get_nowait()
+        queue.put_nowait(line)
+
+
+# Global broadcaster for the roxx.* loggers
+log_broadcaster = LogBroadcaster()
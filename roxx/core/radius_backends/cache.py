@@ -3,6 +3,8 @@ Simple in-memory cache for RADIUS authentication results
 """
 
 from typing import Optional, Tuple
+import hashlib
+import secrets
 import time
 import logging
 from threading import Lock
@@ -142,3 +144,70 @@ class AuthCache:
                 'evictions': self._evictions,
                 'total_gets': self._get_count,
             }
+
+
+class FailureCache:
+    """
+    Short-lived negative cache for rejected credentials.
+    
+    Absorbs bursts of identical (username, password) attempts, e.g. brute-force
+    storms or chatty NAS retries, without hitting the backend chain each time.
+    Only failures are stored; a correct password never matches an entry.
+    """
+    
+    def __init__(self, ttl: float = 2, max_size: int = 10000):
+        """
+        Initialize cache.
+        
+        Args:
+            ttl: Time to live in seconds (default: 2 seconds)
+            max_size: Maximum cache entries (default: 10000)
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._cache = OrderedDict()  # LRU: {(username, password_digest): timestamp}
+        self._key = secrets.token_bytes(32)  # Per-process, digests never leave memory
+        self._hits = 0
+        self._lock = Lock()
+    
+    def _make_key(self, username: str, password: str) -> Tuple[str, bytes]:
+        digest = hashlib.blake2b(password.encode(), digest_size=16, key=self._key).digest()
+        return username, digest
+    
+    def contains(self, username: str, password: str) -> bool:
+        """Return True if this exact credential pair was rejected within TTL."""
+        key = self._make_key(username, password)
+        with self._lock:
+            timestamp = self._cache.get(key)
+            if timestamp is None:
+                return False
+            if time.monotonic() - timestamp > self.ttl:
+                del self._cache[key]
+                return False
+            self._hits += 1
+            return True
+    
+    def add(self, username: str, password: str):
+        """Record a rejected credential pair."""
+        key = self._make_key(username, password)
+        with self._lock:
+            self._cache.pop(key, None)
+            while len(self._cache) >= self.max_size:
+                self._cache.popitem(last=False)  # Remove oldest (LRU)
+            self._cache[key] = time.monotonic()
+    
+    def clear(self):
+        """Clear all cache entries"""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+    
+    def get_stats(self) -> dict:
+        """Get cache statistics"""
+        with self._lock:
+            return {
+                'size': len(self._cache),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hits': self._hits,
+            }
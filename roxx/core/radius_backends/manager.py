@@ -195,9 +195,11 @@ class RadiusBackendManager:
         return False, None
 
     
-    def test_backend(self, backend_type: str, config: dict, test_username: str, test_password: str) -> Tuple[bool, str]:
+    @classmethod
+    def test_backend(cls, backend_type: str, config: dict, test_username: str, test_password: str) -> Tuple[bool, str]:
         """
         Test backend configuration without saving.
+        Stateless: call on the class, no need to load the configured backends.
         
         Args:
             backend_type: Type of backend ('ldap', 'sql', 'file')
@@ -214,7 +216,7 @@ class RadiusBackendManager:
                 config['use_ntlm'] = True
                 backend_type = 'ldap'
             
-            backend_class = self.BACKEND_CLASSES.get(backend_type)
+            backend_class = cls.BACKEND_CLASSES.get(backend_type)
             if not backend_class:
                 return False, f"Unknown backend type: {backend_type}"
             
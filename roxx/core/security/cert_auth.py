@@ -1,6 +1,34 @@
 
+import functools
 import hashlib
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+
+from cryptography import x509
+from cryptography.x509.oid import NameOID
+
+
+def _first_common_name(name: x509.Name) -> str:
+    attributes = name.get_attributes_for_oid(NameOID.COMMON_NAME)
+    return attributes[0].value if attributes else 'Unknown'
+
+
+@functools.lru_cache(maxsize=256)
+def _describe_der_cert(der_cert: bytes) -> Tuple[str, str, str, str]:
+    """
+    Parse and fingerprint a DER certificate once.
+    Clients present the same certificate on every request, so repeated
+    lookups are served from memory instead of re-parsing and re-hashing.
+    """
+    cert = x509.load_der_x509_certificate(der_cert)
+    serial = f"{cert.serial_number:X}"
+    return (
+        _first_common_name(cert.subject),
+        _first_common_name(cert.issuer),
+        hashlib.sha256(der_cert).hexdigest(),
+        # Same even-length uppercase hex as ssl.getpeercert()['serialNumber']
+        serial.zfill(len(serial) + len(serial) % 2),
+    )
+
 
 class CertAuthManager:
     """
@@ -22,30 +50,19 @@ class CertAuthManager:
             if not ssl_object:
                 return None
                 
-            cert = ssl_object.getpeercert()
-            if not cert:
-                return None
-                
-            # If cert is just binary (depending on SSL settings), we might need parsing.
-            # Usually getpeercert() returns a dict if SSLSocket was created with cert_reqs=CERT_OPTIONAL/REQUIRED
-            # AND ca_certs was provided.
-            
-            # Extract basic info
-            subject = dict(x[0] for x in cert['subject'])
-            issuer = dict(x[0] for x in cert['issuer'])
-            
-            # Calculate fingerprint (We need the DER binary for this, which getpeercert(binary_form=True) gives)
-            # But getpeercert() returns either dict OR binary, not both easily without re-calling ?? 
-            # Actually ssl_object.getpeercert(True) gives binary.
-            
+            # A single call returns the DER bytes OpenSSL already holds; the
+            # dict form would re-parse the same certificate into Python objects.
             der_cert = ssl_object.getpeercert(binary_form=True)
-            fingerprint = hashlib.sha256(der_cert).hexdigest()
-            
+            if not der_cert:
+                return None
+
+            common_name, issuer, fingerprint, serial = _describe_der_cert(der_cert)
+
             return {
-                "common_name": subject.get('commonName', 'Unknown'),
-                "issuer": issuer.get('commonName', 'Unknown'),
+                "common_name": common_name,
+                "issuer": issuer,
                 "fingerprint": fingerprint,
-                "serial": cert.get('serialNumber')
+                "serial": serial
             }
             
         except Exception:
@@ -1,8 +1,7 @@
 import os
 import ssl
 from pathlib import Path
-from typing import Tuple
-import shutil
+from typing import Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from cryptography import x509
 from cryptography.x509.oid import NameOID
@@ -23,17 +22,25 @@ class CertManager:
     CERT_FILENAME = "server.crt"
     KEY_FILENAME = "server.key"
 
+    # Resolved once per config dir so status polling doesn't mkdir every call
+    _cached_config_dir: Optional[Path] = None
+    _cached_cert_paths: Optional[Tuple[Path, Path]] = None
+
     @classmethod
     def get_cert_dir(cls) -> Path:
         from roxx.utils.system import SystemManager
-        cert_dir = SystemManager.get_config_dir() / cls.CERT_DIR_NAME
-        cert_dir.mkdir(parents=True, exist_ok=True)
+        config_dir = SystemManager.get_config_dir()
+        cert_dir = config_dir / cls.CERT_DIR_NAME
+        if config_dir != cls._cached_config_dir:
+            cert_dir.mkdir(parents=True, exist_ok=True)
+            cls._cached_config_dir = config_dir
+            cls._cached_cert_paths = (cert_dir / cls.CERT_FILENAME), (cert_dir / cls.KEY_FILENAME)
         return cert_dir
 
     @classmethod
     def get_cert_paths(cls) -> Tuple[Path, Path]:
-        cert_dir = cls.get_cert_dir()
-        return (cert_dir / cls.CERT_FILENAME), (cert_dir / cls.KEY_FILENAME)
+        cls.get_cert_dir()
+        return cls._cached_cert_paths
 
     @classmethod
     def get_status(cls) -> dict:
@@ -70,24 +77,32 @@ class CertManager:
         Saves certificate content to files. 
         Validates that they match and are valid SSL files.
         """
+        # Reject malformed or mismatched PEM in memory before touching disk
+        try:
+            cert = x509.load_pem_x509_certificate(cert_content.encode())
+            key = serialization.load_pem_private_key(key_content.encode(), password=None)
+        except Exception as e:
+            return False, f"Invalid certificate pair: {str(e)}"
+        if cls._public_key_der(cert.public_key()) != cls._public_key_der(key.public_key()):
+            return False, "Invalid certificate pair: certificate does not match private key"
+
         cert_dir = cls.get_cert_dir()
         temp_cert = cert_dir / "temp.crt"
         temp_key = cert_dir / "temp.key"
         
         try:
-            # Save temp
-            with open(temp_cert, 'w') as f:
-                f.write(cert_content)
-            with open(temp_key, 'w') as f:
-                f.write(key_content)
+            # Save temp (flushed to disk so a crash never leaves a half-written key)
+            cls._write_synced(temp_cert, cert_content, 0o644)
+            cls._write_synced(temp_key, key_content, 0o600)
                 
             # Validate
             context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
             context.load_cert_chain(certfile=str(temp_cert), keyfile=str(temp_key))
             
-            # If valid, rename to actual
-            shutil.move(str(temp_cert), str(cert_dir / cls.CERT_FILENAME))
-            shutil.move(str(temp_key), str(cert_dir / cls.KEY_FILENAME))
+            # If valid, atomically rename to actual
+            os.replace(temp_cert, cert_dir / cls.CERT_FILENAME)
+            os.replace(temp_key, cert_dir / cls.KEY_FILENAME)
+            cls._fsync_dir(cert_dir)
             
             return True, "Certificate uploaded and verified successfully."
             
@@ -97,6 +112,34 @@ class CertManager:
             if temp_key.exists(): os.remove(temp_key)
             return False, f"Invalid certificate pair: {str(e)}"
 
+    @staticmethod
+    def _public_key_der(public_key) -> bytes:
+        return public_key.public_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+
+    @staticmethod
+    def _write_synced(path: Path, content: str, mode: int) -> None:
+        """Write text to path and fsync it before returning."""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            os.write(fd, content.encode())
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Persist renames in directory (no-op where directories can't be opened)."""
+        if os.name != "posix":
+            return
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
     @classmethod
     def generate_self_signed_cert(cls, hostname: str = None) -> Tuple[bool, str]:
         """
@@ -4,11 +4,96 @@ Protects against Cross-Site Request Forgery attacks
 """
 
 from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
+import logging
+import os
 import secrets
+import stat
+import tempfile
+import time
+from pathlib import Path
 from typing import Optional
 
-# Secret key for CSRF tokens (in production, load from environment)
-CSRF_SECRET_KEY = secrets.token_hex(32)
+logger = logging.getLogger("roxx.security.csrf")
+
+# Shared slot so every uvicorn worker on the host signs with the same key
+CSRF_KEY_PATH = Path("/dev/shm/roxx_csrf_key")
+
+
+def _read_shared_key(path: Path) -> Optional[str]:
+    """Read the shared key, ignoring files not privately owned by this user"""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0))
+    except FileNotFoundError:
+        return None
+    try:
+        st = os.fstat(fd)
+        if st.st_uid != os.getuid() or st.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+            raise PermissionError(f"Refusing insecure CSRF key file {path}")
+        key = os.read(fd, 256).decode().strip()
+    finally:
+        os.close(fd)
+    bytes.fromhex(key)  # Reject truncated/corrupt content
+    return key
+
+
+def _publish_shared_key(path: Path, key: str) -> Optional[str]:
+    """Publish key at path unless another worker already has; return the key in effect"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".roxx_csrf_key.")
+    try:
+        try:
+            os.write(fd, key.encode())
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        # link() never replaces an existing file, and the key is complete before it appears
+        os.link(tmp, path)
+        return key
+    except FileExistsError:
+        # Another worker won the race; use its key
+        return _read_shared_key(path)
+    finally:
+        os.unlink(tmp)
+
+
+def _fallback_key(reason: str) -> str:
+    logger.warning(
+        "Using a per-process CSRF key (%s); set ROXX_CSRF_KEY when running several workers",
+        reason,
+    )
+    return secrets.token_hex(32)
+
+
+def _load_csrf_secret_key() -> str:
+    """
+    Resolve the CSRF signing key.
+    
+    Priority:
+    1. ROXX_CSRF_KEY environment variable
+    2. Key shared through CSRF_KEY_PATH (published atomically by the first worker)
+    3. Per-process random key (tokens are then only valid on the issuing worker)
+    """
+    configured = os.getenv("ROXX_CSRF_KEY")
+    if configured:
+        return configured
+    
+    if os.name != "posix" or not CSRF_KEY_PATH.parent.is_dir():
+        return _fallback_key(f"{CSRF_KEY_PATH.parent} is unavailable")
+    
+    try:
+        for delay in (0, 0.01, 0.05, 0.2):
+            time.sleep(delay)
+            key = _read_shared_key(CSRF_KEY_PATH)
+            if key is None:
+                key = _publish_shared_key(CSRF_KEY_PATH, secrets.token_hex(32))
+            if key:
+                return key
+    except (OSError, ValueError) as e:
+        return _fallback_key(str(e))
+    return _fallback_key(f"{CSRF_KEY_PATH} is empty")
+
+
+# Secret key for CSRF tokens
+CSRF_SECRET_KEY = _load_csrf_secret_key()
 
 # Token expiration time (1 hour)
 CSRF_TOKEN_EXPIRATION = 3600
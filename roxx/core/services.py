@@ -2,10 +2,12 @@
 Linux service management (systemd) for RoXX
 """
 
+import asyncio
 import subprocess
 from enum import Enum
 import psutil
 
+from roxx.utils.system import SystemManager
 
 
 class ServiceStatus(Enum):
@@ -36,6 +38,14 @@ class ServiceManager:
         """
         service_name = self.SERVICES.get(service, service)
         
+        status = self._get_status_by_systemctl(service_name)
+        if status is None:
+            # Fallback: check via psutil
+            return self._get_status_by_process(service_name)
+        return status
+
+    def _get_status_by_systemctl(self, service_name: str):
+        """Returns the systemd status, or None if systemctl could not be queried"""
         try:
             result = subprocess.run(
                 ['systemctl', 'is-active', service_name],
@@ -45,31 +55,87 @@ class ServiceManager:
             )
             return ServiceStatus.RUNNING if result.returncode == 0 else ServiceStatus.STOPPED
         except Exception:
-            # Fallback: check via psutil
-            return self._get_status_by_process(service_name)
+            return None
+
+    def _get_statuses_by_systemctl(self, service_names: list):
+        """
+        Status of several units from one `systemctl is-active` call
+        (one line per unit, in order), or None if systemctl could not be queried
+        """
+        try:
+            result = subprocess.run(
+                ['systemctl', 'is-active', *service_names],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            states = result.stdout.split()
+        except Exception:
+            return None
+        if len(states) != len(service_names):
+            return None
+        return {
+            name: ServiceStatus.RUNNING if state == 'active' else ServiceStatus.STOPPED
+            for name, state in zip(service_names, states)
+        }
+
+    async def get_status_async(self, service: str) -> ServiceStatus:
+        """
+        Non-blocking variant of get_status for use inside async handlers
+        """
+        service_name = self.SERVICES.get(service, service)
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'systemctl', 'is-active', service_name,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            try:
+                returncode = await asyncio.wait_for(proc.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+            return ServiceStatus.RUNNING if returncode == 0 else ServiceStatus.STOPPED
+        except Exception:
+            # Fallback: check via psutil (off the event loop)
+            return await asyncio.to_thread(self._get_status_by_process, service_name)
 
     def _get_status_by_process(self, service_name: str) -> ServiceStatus:
         """Fallback: check via running processes"""
+        return self._get_statuses_by_process([service_name])[service_name]
+
+    def _get_statuses_by_process(self, service_names: list) -> dict:
+        """Fallback for several services with a single walk of the process table"""
+        pending = {name: name.lower() for name in service_names}
+        statuses = dict.fromkeys(service_names, ServiceStatus.STOPPED)
         try:
             for proc in psutil.process_iter(['name', 'cmdline']):
                 try:
-                    if service_name.lower() in proc.info['name'].lower():
-                        return ServiceStatus.RUNNING
+                    # Search name and cmdline together so each process is lowered once
+                    haystack = (proc.info['name'] or '').lower()
                     if proc.info['cmdline']:
-                        cmdline = ' '.join(proc.info['cmdline']).lower()
-                        if service_name.lower() in cmdline:
-                            return ServiceStatus.RUNNING
+                        haystack += '\0' + ' '.join(proc.info['cmdline']).lower()
+                    found = [name for name, needle in pending.items() if needle in haystack]
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
-            return ServiceStatus.STOPPED
-        except:
-            return ServiceStatus.UNKNOWN
+                for name in found:
+                    statuses[name] = ServiceStatus.RUNNING
+                    del pending[name]
+                if not pending:
+                    break
+            return statuses
+        except Exception:
+            return dict.fromkeys(service_names, ServiceStatus.UNKNOWN)
 
     def start(self, service: str) -> bool:
         """Start a service"""
         service_name = self.SERVICES.get(service, service)
         try:
-            subprocess.run(['systemctl', 'start', service_name], check=True, timeout=10)
+            SystemManager.run_command(
+                ['systemctl', 'start', service_name], check=True, timeout=10, discard_output=True
+            )
             return True
         except Exception:
             return False
@@ -78,7 +144,9 @@ class ServiceManager:
         """Stop a service"""
         service_name = self.SERVICES.get(service, service)
         try:
-            subprocess.run(['systemctl', 'stop', service_name], check=True, timeout=10)
+            SystemManager.run_command(
+                ['systemctl', 'stop', service_name], check=True, timeout=10, discard_output=True
+            )
             return True
         except Exception:
             return False
@@ -87,15 +155,26 @@ class ServiceManager:
         """Restart a service"""
         service_name = self.SERVICES.get(service, service)
         try:
-            subprocess.run(['systemctl', 'restart', service_name], check=True, timeout=10)
+            SystemManager.run_command(
+                ['systemctl', 'restart', service_name], check=True, timeout=10, discard_output=True
+            )
             return True
         except Exception:
             return False
 
     def get_all_services_status(self) -> dict:
         """Returns the status of all configured services"""
-        return {
-            service: self.get_status(service)
-            for service in self.SERVICES.keys()
-        }
+        service_names = list(self.SERVICES.values())
+        statuses = self._get_statuses_by_systemctl(service_names)
+        if statuses is None:
+            # Fallback: one walk of the process table for every service
+            statuses = self._get_statuses_by_process(service_names)
+
+        return {service: statuses[service_name] for service, service_name in self.SERVICES.items()}
+
+    async def get_all_services_status_async(self) -> dict:
+        """Returns the status of all configured services, probed concurrently"""
+        services = list(self.SERVICES.keys())
+        statuses = await asyncio.gather(*(self.get_status_async(s) for s in services))
+        return dict(zip(services, statuses))
 
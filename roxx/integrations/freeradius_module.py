@@ -46,6 +46,10 @@ if ROXX_PATH not in sys.path:
 try:
     from roxx.core.radius_backends.manager import get_manager
     from roxx.core.radius_backends.config_db import RadiusBackendDB
+    from roxx.core.radius_backends.cache import FailureCache
+    
+    # Recently rejected credentials, to absorb repeated identical attempts
+    failure_cache = FailureCache(ttl=2, max_size=10000)
     
     # Initialize database
     RadiusBackendDB.init()
@@ -76,11 +80,7 @@ def authorize(p):
     log(radiusd.L_INFO, "authorize() called")
     
     # Extract username from packet
-    username = None
-    for item in p:
-        if item[0] == 'User-Name':
-            username = item[1]
-            break
+    username = dict(p).get('User-Name')
     
     if username:
         log(radiusd.L_INFO, f"Authorizing user: {username}")
@@ -106,15 +106,10 @@ def authenticate(p):
         log(radiusd.L_ERR, "Backend manager not initialized")
         return radiusd.RLM_MODULE_FAIL
     
-    # Extract username and password from packet
-    username = None
-    password = None
-    
-    for item in p:
-        if item[0] == 'User-Name':
-            username = item[1]
-        elif item[0] == 'User-Password':
-            password = item[1]
+    # Extract username and password from packet (tuple of (name, value) pairs)
+    attrs = dict(p)
+    username = attrs.get('User-Name')
+    password = attrs.get('User-Password')
     
     if not username or not password:
         log(radiusd.L_ERR, "Missing username or password")
@@ -122,6 +117,10 @@ def authenticate(p):
     
     log(radiusd.L_INFO, f"Authenticating user: {username}")
     
+    if failure_cache.contains(username, password):
+        log(radiusd.L_AUTH, f"Authentication failed for {username} (recently rejected)")
+        return radiusd.RLM_MODULE_REJECT
+    
     try:
         # Authenticate using backend manager
         success, attributes = manager.authenticate(username, password)
@@ -130,15 +129,13 @@ def authenticate(p):
             log(radiusd.L_INFO, f"Authentication successful for {username}")
             
             # Build reply tuple from attributes
-            reply_tuple = ()
-            if attributes:
-                for attr_name, attr_value in attributes.items():
-                    reply_tuple += ((attr_name, attr_value),)
+            reply_tuple = tuple(attributes.items()) if attributes else ()
             
             # Return success with attributes
             return (radiusd.RLM_MODULE_OK, reply_tuple, ())
         else:
             log(radiusd.L_AUTH, f"Authentication failed for {username}")
+            failure_cache.add(username, password)
             return radiusd.RLM_MODULE_REJECT
             
     except Exception as e:
@@ -159,11 +156,7 @@ def post_auth(p):
     log(radiusd.L_INFO, "post_auth() called")
     
     # Extract username
-    username = None
-    for item in p:
-        if item[0] == 'User-Name':
-            username = item[1]
-            break
+    username = dict(p).get('User-Name')
     
     if username:
         log(radiusd.L_INFO, f"Post-auth for {username}")
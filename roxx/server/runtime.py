@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import os
+import importlib.util
 import logging
 import ssl
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
 import uvicorn
+from uvicorn.supervisors import Multiprocess
 
 from roxx.core.security.cert_manager import CertManager
 from roxx.server.logging import configure_service_logging
@@ -31,6 +33,11 @@ def _env_int(name: str, default: int) -> int:
     return int(raw)
 
 
+def _preferred_impl(module: str) -> str:
+    """Name the C-accelerated uvicorn implementation when it is installed, else "auto"."""
+    return module if importlib.util.find_spec(module) is not None else "auto"
+
+
 @dataclass
 class ServerRuntimeConfig:
     host: str = "0.0.0.0"
@@ -49,6 +56,9 @@ class ServerRuntimeConfig:
     ssl_certfile: Optional[str] = None
     ssl_keyfile: Optional[str] = None
     ssl_ca_certs: Optional[str] = None
+    loop: str = field(default_factory=lambda: _preferred_impl("uvloop"))
+    http: str = field(default_factory=lambda: _preferred_impl("httptools"))
+    workers: int = 1
 
     @classmethod
     def from_env(cls) -> "ServerRuntimeConfig":
@@ -73,6 +83,9 @@ class ServerRuntimeConfig:
             ssl_certfile=os.getenv("ROXX_SSL_CERTFILE"),
             ssl_keyfile=os.getenv("ROXX_SSL_KEYFILE"),
             ssl_ca_certs=os.getenv("ROXX_SSL_CA_CERTS"),
+            loop=os.getenv("ROXX_LOOP") or _preferred_impl("uvloop"),
+            http=os.getenv("ROXX_HTTP") or _preferred_impl("httptools"),
+            workers=_env_int("ROXX_WORKERS", 1),
         )
         if os.getenv("ROXX_SECURITY_PROFILE", "standard").lower() == "production":
             if not config.ssl_required:
@@ -130,6 +143,9 @@ def build_uvicorn_config(config: Optional[ServerRuntimeConfig] = None) -> uvicor
         "timeout_keep_alive": config.timeout_keep_alive,
         "backlog": config.backlog,
         "root_path": config.root_path,
+        "loop": config.loop,
+        "http": config.http,
+        "workers": config.workers,
     }
 
     if config.limit_concurrency is not None:
@@ -158,10 +174,20 @@ def run_web_server(
     stop_event: Optional[threading.Event] = None,
 ) -> int:
     runtime_config = config or ServerRuntimeConfig.from_env()
+    multiprocess = runtime_config.workers > 1 and stop_event is None
+    if multiprocess and not os.getenv("ROXX_SECRET_KEY"):
+        # Workers would each generate their own session key and reject each other's cookies
+        raise RuntimeError("ROXX_WORKERS > 1 requires ROXX_SECRET_KEY to be set")
     log_file = configure_service_logging(runtime_config.log_level)
     logging.getLogger("roxx.server").info("Service logging initialized: %s", log_file)
     server = create_server(runtime_config)
 
+    if multiprocess:
+        # Each worker process imports the app from config.app_import
+        sock = server.config.bind_socket()
+        Multiprocess(server.config, sockets=[sock]).run()
+        return 0
+
     if stop_event is not None:
         def _watch_stop() -> None:
             stop_event.wait()
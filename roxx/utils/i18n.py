@@ -2,23 +2,77 @@
 Internationalization utilities for RoXX
 """
 
-import json
+import sys
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+import orjson
 
 from roxx.utils.system import SystemManager
 
+# Cache key for the catalog compiled by scripts/compile_locales.py
+COMPILED_CATALOG = "<compiled>"
+
+
+def _load_compiled_translations() -> Optional[Dict]:
+    """Return the precompiled catalog shipped with the package, if present"""
+    try:
+        from roxx.utils._locales_compiled import TRANSLATIONS
+    except ImportError:
+        return None
+    return TRANSLATIONS
+
+
+def _intern_catalog(catalog: Dict) -> Dict:
+    """Intern every translated string in place so duplicates share one object"""
+    for per_locale in catalog.values():
+        if isinstance(per_locale, dict):
+            for locale, text in per_locale.items():
+                if isinstance(text, str):
+                    per_locale[locale] = sys.intern(text)
+    return catalog
+
 
 class I18n:
     """Internationalization manager"""
 
+    # Parsed catalogs shared by every instance, keyed by source file path
+    _translations_cache: Dict[str, Dict] = {}
+    # (locale, key) -> text tables built from those catalogs, keyed by source file path
+    _flat_cache: Dict[str, Dict[Tuple[str, str], str]] = {}
+
     def __init__(self, locale: str = "EN"):
         self.locale = locale.upper()
-        self.translations: Dict = {}
-        self.load_translations()
+        # Loaded on first translate() so importing the module costs no I/O
+        self.translations: Optional[Dict] = None
+        self._source: Optional[str] = None
+        self._flat: Optional[Dict[Tuple[str, str], str]] = None
 
     def load_translations(self):
         """Load translations from JSON file"""
+        self._source, self.translations = self._read_translations()
+        self._flat = None
+        self._ensure_loaded()
+
+    def _ensure_loaded(self) -> Dict[Tuple[str, str], str]:
+        """Load the catalog and build its flat table on first use"""
+        if self._flat is None:
+            if self.translations is None:
+                self._source, self.translations = self._read_translations()
+            self._flat = self._get_flat()
+        return self._flat
+
+    def _read_translations(self) -> Tuple[Optional[str], Dict]:
+        """Return (source path, catalog) for the first readable catalog, or the defaults"""
+        # The compiled catalog replaces roxx/config/locales.json without any JSON parsing
+        cached = I18n._translations_cache.get(COMPILED_CATALOG)
+        if cached is not None:
+            return COMPILED_CATALOG, cached
+        compiled = _load_compiled_translations()
+        if compiled is not None:
+            I18n._translations_cache[COMPILED_CATALOG] = _intern_catalog(compiled)
+            return COMPILED_CATALOG, compiled
+
         # Search first in roxx/config/, then in share/
         config_dir = SystemManager.get_config_dir()
         possible_paths = [
@@ -27,18 +81,45 @@ class I18n:
             Path("/usr/local/share/dict.locales.json"),  # Legacy
         ]
 
+        # Open each candidate directly instead of stat()ing it first: a cache hit
+        # costs no syscall and a miss is a single open() (FileNotFoundError is an IOError)
         for path in possible_paths:
-            if path.exists():
-                try:
-                    with open(path, 'r', encoding='utf-8') as f:
-                        self.translations = json.load(f)
-                    return
-                except (json.JSONDecodeError, IOError, UnicodeDecodeError):
-                    # If error, continue with next file
-                    continue
+            key = str(path)
+            cached = I18n._translations_cache.get(key)
+            if cached is not None:
+                return key, cached
+            try:
+                # orjson parses the raw UTF-8 bytes, skipping a separate decode step
+                translations = _intern_catalog(orjson.loads(path.read_bytes()))
+                I18n._translations_cache[key] = translations
+                return key, translations
+            except (orjson.JSONDecodeError, IOError, UnicodeDecodeError):
+                # If error, continue with next file
+                continue
 
         # If no file found or all errors, use default translations
-        self.translations = self._get_default_translations()
+        return None, _intern_catalog(self._get_default_translations())
+
+    def _get_flat(self) -> Dict[Tuple[str, str], str]:
+        """Flatten the catalog to (locale, key) -> text for every locale at once"""
+        shared = (
+            self._source is not None
+            and I18n._translations_cache.get(self._source) is self.translations
+        )
+        if shared:
+            cached = I18n._flat_cache.get(self._source)
+            if cached is not None:
+                return cached
+
+        flat = {
+            (locale, key): text
+            for key, per_locale in self.translations.items()
+            if isinstance(per_locale, dict)
+            for locale, text in per_locale.items()
+        }
+        if shared:
+            I18n._flat_cache[self._source] = flat
+        return flat
 
     def _get_default_translations(self) -> Dict:
         """Minimal default translations"""
@@ -84,29 +165,50 @@ class I18n:
         Returns:
             Translated text or the key itself if not found
         """
-        if key in self.translations:
-            return self.translations[key].get(self.locale, key)
+        flat = self._flat
+        if flat is None:
+            flat = self._ensure_loaded()
+        text = flat.get((self.locale, key))
+        if text is not None:
+            return text
+        # A known key without this locale falls back to the key, not the default
+        if isinstance(self.translations.get(key), dict):
+            return key
         return default or key
 
     def set_locale(self, locale: str):
         """Change language"""
+        # The flat table covers every locale, so nothing needs rebuilding
         self.locale = locale.upper()
 
+    @classmethod
+    def invalidate_cache(cls):
+        """Forget parsed catalogs so the next load re-reads them from disk"""
+        cls._translations_cache.clear()
+        cls._flat_cache.clear()
+
+
+# Global instance, created on first use
+_i18n: Optional[I18n] = None
+
 
-# Global instance
-_i18n = I18n()
+def _get_i18n() -> I18n:
+    global _i18n
+    if _i18n is None:
+        _i18n = I18n()
+    return _i18n
 
 
 def translate(key: str, default: Optional[str] = None) -> str:
     """Helper function to translate"""
-    return _i18n.translate(key, default)
+    return _get_i18n().translate(key, default)
 
 
 def set_locale(locale: str):
     """Change global language"""
-    _i18n.set_locale(locale)
+    _get_i18n().set_locale(locale)
 
 
 def get_locale() -> str:
     """Return current language"""
-    return _i18n.locale
+    return _get_i18n().locale
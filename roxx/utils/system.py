@@ -8,28 +8,123 @@ import platform
 import subprocess
 import shutil
 import psutil
-import datetime
-from pathlib import Path
-from typing import Optional
-
+import functools
+import mmap
+import re
+import shlex
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_config_dir(configured: Optional[str]) -> Path:
+    """Resolve the config dir once per ROXX_CONFIG_DIR value"""
+    if configured is not None:
+        return Path(configured)
+
+    # Dev Convenience: Check local config dir first
+    local_config = Path("config")
+    if local_config.is_dir():
+        return local_config.absolute()
+
+    return Path('/etc/roxx')
+
+
+@functools.lru_cache(maxsize=None)
+def _env_path(value: str) -> Path:
+    return Path(value)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_os_release() -> dict:
+    """Parse /etc/os-release once; it does not change while we run"""
+    fields = {}
+    try:
+        with open("/etc/os-release") as f:
+            for line in f:
+                key, sep, value = line.strip().partition("=")
+                if not sep or key.startswith("#"):
+                    continue
+                try:
+                    parts = shlex.split(value)
+                except ValueError:
+                    continue
+                fields[key] = parts[0] if parts else ""
+    except OSError:
+        pass
+    return fields
+
+
+def _read_proc(path: str) -> bytes:
+    """Read a whole /proc file with raw os calls (no Python file object)"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _proc_disk_bytes() -> tuple:
+    """(read_bytes, write_bytes) summed over whole disks from /proc/diskstats"""
+    disks = set(os.listdir("/sys/block"))
+    read_sectors = write_sectors = 0
+    for line in _read_proc("/proc/diskstats").splitlines():
+        fields = line.split()
+        # major minor name reads merged sectors_read ms writes merged sectors_written ...
+        if len(fields) < 10 or fields[2].decode() not in disks:
+            continue
+        read_sectors += int(fields[5])
+        write_sectors += int(fields[9])
+    # diskstats always counts 512-byte sectors
+    return read_sectors * 512, write_sectors * 512
+
+
+def _proc_net_bytes() -> tuple:
+    """(bytes_sent, bytes_recv) summed over all interfaces from /proc/net/dev"""
+    sent = recv = 0
+    for line in _read_proc("/proc/net/dev").splitlines()[2:]:
+        _, _, counters = line.partition(b":")
+        fields = counters.split()
+        if len(fields) < 9:
+            continue
+        recv += int(fields[0])
+        sent += int(fields[8])
+    return sent, recv
+
+
 class SystemManager:
     """Linux System Utilities"""
+
+    # Directories already known to exist, so repeated ensure_directories() calls are free
+    _ensured_dirs: set = set()
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_os() -> str:
         """Returns the operating system description"""
         try:
             # Try to get pretty name from os-release
-            if Path("/etc/os-release").exists():
-                with open("/etc/os-release") as f:
-                    for line in f:
-                        if line.startswith("PRETTY_NAME="):
-                            return line.split("=")[1].strip().strip('"')
+            pretty_name = _read_os_release().get("PRETTY_NAME")
+            if pretty_name:
+                return pretty_name
             
             # Fallback to platform
             return platform.system() + " " + platform.release()
         except:
             return "Linux (Unknown)"
+
+    @staticmethod
+    def get_os_release_field(key: str, default: Optional[str] = None) -> Optional[str]:
+        """Returns a field from /etc/os-release (e.g. ID, VERSION_ID)"""
+        return _read_os_release().get(key, default)
             
     @staticmethod
     def get_kernel_version() -> str:
@@ -43,10 +138,18 @@ class SystemManager:
     def get_uptime() -> str:
         """Returns system uptime string"""
         try:
-            boot_time = datetime.datetime.fromtimestamp(psutil.boot_time())
-            uptime = datetime.datetime.now() - boot_time
-            # Format: "2 days, 4:32"
-            return str(uptime).split('.')[0]
+            if hasattr(time, 'CLOCK_BOOTTIME'):
+                secs = int(time.clock_gettime(time.CLOCK_BOOTTIME))
+            else:
+                secs = int(time.time() - psutil.boot_time())
+            # Format: "2 days, 4:32:10" (same as str(timedelta) without microseconds)
+            days, rem = divmod(secs, 86400)
+            hours, rem = divmod(rem, 3600)
+            minutes, seconds = divmod(rem, 60)
+            clock = f"{hours}:{minutes:02}:{seconds:02}"
+            if days:
+                return f"{days} day{'s' if days != 1 else ''}, {clock}"
+            return clock
         except:
             return "Unknown"
 
@@ -91,9 +194,16 @@ class SystemManager:
     def get_advanced_metrics() -> dict:
         """Returns IO counters and Load averages"""
         try:
-            # IO Counters
-            io = psutil.disk_io_counters()
-            net = psutil.net_io_counters()
+            # IO Counters: read /proc directly on Linux, psutil elsewhere
+            try:
+                disk_read, disk_write = _proc_disk_bytes()
+                net_sent, net_recv = _proc_net_bytes()
+            except OSError:
+                io = psutil.disk_io_counters()
+                net = psutil.net_io_counters()
+                disk_read = io.read_bytes if io else 0
+                disk_write = io.write_bytes if io else 0
+                net_sent, net_recv = net.bytes_sent, net.bytes_recv
             
             # Load Avg (Unix only usually, but psutil handles basic)
             # On Windows getloadavg might not work, fallback to cpu percent
@@ -106,10 +216,10 @@ class SystemManager:
                 load = (0, 0, 0)
 
             return {
-                "disk_read_mb": round(io.read_bytes / (1024**2), 2),
-                "disk_write_mb": round(io.write_bytes / (1024**2), 2),
-                "net_sent_mb": round(net.bytes_sent / (1024**2), 2),
-                "net_recv_mb": round(net.bytes_recv / (1024**2), 2),
+                "disk_read_mb": round(disk_read / (1024**2), 2),
+                "disk_write_mb": round(disk_write / (1024**2), 2),
+                "net_sent_mb": round(net_sent / (1024**2), 2),
+                "net_recv_mb": round(net_recv / (1024**2), 2),
                 "load_1m": load[0],
                 "load_5m": load[1],
                 "process_count": len(psutil.pids()),
@@ -127,11 +237,34 @@ class SystemManager:
             }
 
     @staticmethod
-    def is_service_running(service_name: str) -> bool:
-        """Checks if a process is running"""
+    def is_service_running(*service_names: str) -> bool:
+        """Checks if a process matching any of the given names is running"""
+        # Linux: read only /proc/<pid>/comm (one open+read per pid) instead of
+        # building a psutil.Process for every pid. comm is capped at 15 chars.
+        # Several names are matched in the same pass over /proc.
+        if all(len(name) <= 15 for name in service_names):
+            try:
+                entries = os.scandir('/proc')
+            except OSError:
+                entries = None
+            if entries is not None:
+                needles = [name.encode() for name in service_names]
+                with entries:
+                    for entry in entries:
+                        if not entry.name.isdigit():
+                            continue
+                        try:
+                            with open(f'/proc/{entry.name}/comm', 'rb') as f:
+                                comm = f.read()
+                        except OSError:
+                            continue
+                        if any(needle in comm for needle in needles):
+                            return True
+                return False
+
         try:
             for proc in psutil.process_iter(['name']):
-                if service_name in proc.info['name']:
+                if any(name in proc.info['name'] for name in service_names):
                     return True
             return False
         except:
@@ -154,56 +287,46 @@ class SystemManager:
         2. Local 'config' directory (Dev convenience)
         3. /etc/roxx (Default)
         """
-        if 'ROXX_CONFIG_DIR' in os.environ:
-            return Path(os.environ['ROXX_CONFIG_DIR'])
-            
-        # Dev Convenience: Check local config dir first
-        local_config = Path("config")
-        if local_config.exists() and local_config.is_dir():
-             return local_config.absolute()
-             
-        return Path('/etc/roxx')
+        return _resolve_config_dir(os.environ.get('ROXX_CONFIG_DIR'))
     
     @staticmethod
     def get_data_dir() -> Path:
         """/var/lib/roxx or ROXX_DATA_DIR"""
-        return Path(os.getenv('ROXX_DATA_DIR', '/var/lib/roxx'))
+        return _env_path(os.getenv('ROXX_DATA_DIR', '/var/lib/roxx'))
     
     @staticmethod
     def get_log_dir() -> Path:
         """/var/log/roxx or ROXX_LOG_DIR"""
-        return Path(os.getenv('ROXX_LOG_DIR', '/var/log/roxx'))
+        return _env_path(os.getenv('ROXX_LOG_DIR', '/var/log/roxx'))
 
     @staticmethod
     def get_radius_log_file() -> Path:
         """/var/log/freeradius/radius.log or ROXX_RADIUS_LOG"""
-        return Path(os.getenv('ROXX_RADIUS_LOG', '/var/log/freeradius/radius.log'))
+        return _env_path(os.getenv('ROXX_RADIUS_LOG', '/var/log/freeradius/radius.log'))
+
+    @staticmethod
+    def clear_dir_cache():
+        """Forget resolved directories (e.g. after chdir or creating ./config)"""
+        _resolve_config_dir.cache_clear()
+        _env_path.cache_clear()
+        SystemManager._ensured_dirs.clear()
 
     @staticmethod
     def add_radius_user(username: str, password: str, attribute: str = "Cleartext-Password", op: str = ":=") -> bool:
         """Adds a user to users.conf"""
         try:
             users_file = SystemManager.get_config_dir() / "users.conf"
-            # Ensure config directory exists (crucial for local dev/Windows)
-            if not users_file.parent.exists():
-                users_file.parent.mkdir(parents=True, exist_ok=True)
 
             # format: username attribute op password
             entry = f'{username} {attribute} {op} "{password}"\n'
             
-            # Simple append (not checking duplicates for MVP flexibility, but ideally should)
-            # Better: read, filter, append.
-            current_lines = []
-            if users_file.exists():
-                with open(users_file, 'r') as f:
-                    current_lines = f.readlines()
-            
-            # Remove existing user if any to avoid duplicates
-            clean_lines = [l for l in current_lines if not l.strip().startswith(f"{username} ")]
-            clean_lines.append(entry)
-            
-            with open(users_file, 'w') as f:
-                f.writelines(clean_lines)
+            # Replace any existing entry for the user to avoid duplicates
+            try:
+                SystemManager._rewrite_users_file(users_file, username, entry)
+            except FileNotFoundError:
+                # Config directory missing (crucial for local dev/Windows)
+                users_file.parent.mkdir(parents=True, exist_ok=True)
+                SystemManager._rewrite_users_file(users_file, username, entry)
             return True
         except Exception as e:
             print(f"Error adding user: {e}")
@@ -213,54 +336,120 @@ class SystemManager:
     def delete_radius_user(username: str) -> bool:
         """Removes a user from users.conf"""
         try:
-            users_file = SystemManager.get_config_dir() / "users.conf"
-            if not users_file.exists():
-                return False
-                
-            with open(users_file, 'r') as f:
-                lines = f.readlines()
-            
             if username.startswith('#'):
                 return False # Safety: Cannot delete comments
-                
-            clean_lines = [l for l in lines if not l.strip().startswith(f"{username} ")]
-            
-            with open(users_file, 'w') as f:
-                f.writelines(clean_lines)
+
+            users_file = SystemManager.get_config_dir() / "users.conf"
+            SystemManager._rewrite_users_file(users_file, username)
             return True
+        except FileNotFoundError:
+            return False
         except Exception as e:
             print(f"Error deleting user: {e}")
             return False
     
+    @staticmethod
+    def _rewrite_users_file(users_file: Path, username: str, entry: Optional[str] = None):
+        """
+        Copies users.conf into a temp file in the same directory, dropping
+        the user's existing lines and appending entry, then atomically
+        swaps it into place so readers never see a partial file.
+        Raises FileNotFoundError if users.conf is missing and there is no
+        entry to write.
+        """
+        # Work on raw bytes: no per-line decode, and line endings are kept as-is.
+        # The file is mmapped and the user's lines are located with one regex
+        # scan, so only the spans between matches are copied (no per-line objects).
+        user_lines = re.compile(
+            rb'^[ \t\r\x0b\x0c]*' + re.escape(f"{username} ".encode()) + rb'[^\n]*(?:\n|\Z)',
+            re.MULTILINE
+        )
+        fd, tmp_name = tempfile.mkstemp(dir=users_file.parent, prefix=".users.conf.")
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                last_chunk = b''
+                try:
+                    with open(users_file, 'rb') as src:
+                        st = os.fstat(src.fileno())
+                        # mmap cannot map an empty file
+                        data = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) if st.st_size else b''
+                        try:
+                            pos = 0
+                            for match in user_lines.finditer(data):
+                                if match.start() > pos:
+                                    last_chunk = data[pos:match.start()]
+                                    tmp.write(last_chunk)
+                                pos = match.end()
+                            if pos < len(data):
+                                last_chunk = data[pos:]
+                                tmp.write(last_chunk)
+                        finally:
+                            if isinstance(data, mmap.mmap):
+                                data.close()
+                    # Keep the original permissions/ownership (FreeRADIUS must read it)
+                    os.chmod(tmp_name, st.st_mode & 0o7777)
+                    if hasattr(os, 'chown'):
+                        try:
+                            os.chown(tmp_name, st.st_uid, st.st_gid)
+                        except PermissionError:
+                            pass
+                except FileNotFoundError:
+                    if entry is None:
+                        raise
+                    os.chmod(tmp_name, 0o644)
+
+                if entry is not None:
+                    if last_chunk and not last_chunk.endswith(b'\n'):
+                        tmp.write(b'\n')
+                    tmp.write(entry.encode())
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_name, users_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
+    
     @staticmethod
     def run_command(
         command: list,
         check: bool = False,
         capture_output: bool = True,
-        text: bool = True,
-        timeout: Optional[int] = None
+        text: bool = True,
+        timeout: Optional[int] = None,
+        discard_output: bool = False
     ) -> subprocess.CompletedProcess:
         """
         Executes a system command
+
+        With discard_output=True stdout/stderr go to /dev/null (no pipes or
+        reader buffers) for commands where only the return code matters.
         """
+        if discard_output:
+            output = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
+        else:
+            output = {"capture_output": capture_output}
+
         if platform.system() == "Windows" and command:
             executable = shutil.which(command[0])
             if executable is None and command[0].lower() in {"echo", "dir", "copy", "del", "type"}:
                 return subprocess.run(
                     " ".join(command),
                     check=check,
-                    capture_output=capture_output,
                     text=text,
                     timeout=timeout,
-                    shell=True
+                    shell=True,
+                    **output
                 )
 
         return subprocess.run(
             command,
             check=check,
-            capture_output=capture_output,
-            text=text,
-            timeout=timeout
+            text=text,
+            timeout=timeout,
+            **output
         )
     
     @staticmethod
@@ -273,8 +462,13 @@ class SystemManager:
         ]
         
         for directory in dirs:
+            if directory in SystemManager._ensured_dirs:
+                continue
             try:
-                directory.mkdir(parents=True, exist_ok=True)
+                # A single stat covers the common case where the tree already exists
+                if not os.path.isdir(directory):
+                    os.makedirs(directory, exist_ok=True)
+                SystemManager._ensured_dirs.add(directory)
             except PermissionError:
                 # Expected if not running as root during dev/test
                 pass
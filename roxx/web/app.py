@@ -3,35 +3,70 @@ RoXX Web Interface - Modern FastAPI Application
 Replaces the old SimpleSAMLphp interface with a modern Python web app
 """
 
-from fastapi import FastAPI, Request, Form, HTTPException, Depends, WebSocket, UploadFile, File
+from fastapi import FastAPI, Request, Form, HTTPException, Depends, WebSocket, WebSocketDisconnect, UploadFile, File
 from contextlib import asynccontextmanager
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from roxx.core.audit.manager import AuditManager
 from roxx.core.audit.db import AuditDatabase
 from slowapi.errors import RateLimitExceeded
 from roxx.core.security.rate_limit import limiter
-import qrcode
-import io
+from roxx.web.responses import ORJSONResponse
+from roxx.web.schemas import (
+    AuthProviderCreate,
+    AuthProviderTest,
+    AuthProviderUpdate,
+    RadiusAuthRequest,
+    RadiusBackendCreate,
+    RadiusBackendTest,
+    RadiusBackendUpdate,
+)
+import anyio
+import asyncio
 import base64
-import os
+import binascii
+import functools
+import hashlib
+import hmac
+import os
+import platform
 import secrets
 import logging
 import json
+import mmap
 import sqlite3
 import random
 import re
 import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List
+from typing import Optional, Tuple
 
+from roxx.core.health import HealthManager
 from roxx.core.observability import request_metrics
 from roxx.core.security.profiles import SecurityProfile
 from roxx.utils.system import SystemManager
 from roxx.core.auth.saml_provider import SAMLProvider
+from roxx.core.auth.cert_db import CertDatabase
+from roxx.core.auth.config_db import ConfigManager
+from roxx.core.auth.duo import DuoProvider
+from roxx.core.auth.email import EmailProvider
+from roxx.core.auth.okta import OktaProvider
+from roxx.core.auth.webauthn_db import WebAuthnDatabase
+from roxx.core.integrity import IntegrityManager
+from roxx.core.logging import log_broadcaster
+from roxx.core.radius_backends import manager as radius_backend_manager
+from roxx.core.radius_backends.manager import RadiusBackendManager
+from roxx.core.security.cert_auth import CertAuthManager
+from roxx.core.security.cert_manager import CertManager
+from roxx.core.security.pki import PKIManager
+from roxx.utils.nps_importer import NPSImporter
 from roxx.core.auth.rbac import (
     Role,
     Action,
@@ -44,6 +79,16 @@ from roxx.core.auth.rbac import (
 
 logger = logging.getLogger("roxx.web")
 
+# bcrypt runs on its own pool, sized to the cores, so a burst of logins
+# cannot starve the default thread pool used for file and DB I/O.
+KDF_EXEC = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="kdf")
+
+
+async def run_kdf(func, *args, **kwargs):
+    """Run a password hashing/verification call on the KDF executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(KDF_EXEC, functools.partial(func, *args, **kwargs))
+
 # ------------------------------------------------------------------------------
 # Security & Authentication
 # ------------------------------------------------------------------------------
@@ -70,13 +115,20 @@ async def lifespan(app: FastAPI):
     Replaces the deprecated @app.on_event system.
     """
     # 🏁 Startup Logic
-    from roxx.core.auth.webauthn import WebAuthnManager
-    from roxx.core.auth.cert_db import CertDatabase
-    from roxx.core.integrity import IntegrityManager
-    
     WebAuthnManager.init()
     CertDatabase.init_db()
-    
+
+    # Plain ``def`` endpoints and dependencies run on AnyIO's worker pool (40 by default)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
+
+    # One handler on the roxx.* loggers formats each record once and fans it out
+    # to a bounded queue per connected /ws/logs client
+    logging.getLogger("roxx").addHandler(log_broadcaster)
+
+    # Compile every page template once so the first request doesn't pay for it
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.env.get_template(name)
+    
     # 🛡️ Integrity Check on Startup
     # In a production build, the expected_manifest would be signed and baked into the binary.
     # For this phase, we generate it to ensure we start from a known good state.
@@ -95,18 +147,23 @@ async def lifespan(app: FastAPI):
     yield
     # 🛑 Shutdown Logic (if any)
     logger.info("Cleaning up resources on shutdown...")
+    logging.getLogger("roxx").removeHandler(log_broadcaster)
 
 app = FastAPI(
     title="RoXX Admin Interface",
     description="Modern web interface for RoXX RADIUS Authentication Proxy",
     version=VERSION,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Initialize Rate Limiter
 app.state.limiter = limiter
 
 security_profile = SecurityProfile.from_env()
+
+# Paths whose error responses are JSON rather than rendered HTML pages
+JSON_ERROR_PATH_PREFIXES = ("/api", "/auth")
 
 @app.middleware("http")
 async def add_integrity_headers(request: Request, call_next):
@@ -130,6 +187,9 @@ async def add_integrity_headers(request: Request, call_next):
     if security_profile.hsts:
         response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
     response.headers["X-Developed-For"] = "SH-PX Framework (Confidential)"
+    # static_url() links carry a content hash, so those URLs never change content
+    if request.scope["path"].startswith("/static/") and request.query_params.get("v"):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
     return response
 
 @app.exception_handler(RateLimitExceeded)
@@ -138,18 +198,19 @@ async def rate_limit_exception_handler(request: Request, exc: RateLimitExceeded)
     Custom handler for RateLimitExceeded using Jinja2 templates and logging
     """
     client_ip = request.client.host if request.client else "unknown"
-    logger.warning(f"RATE LIMIT EXCEEDED: {client_ip} tried to access {request.url.path} - {exc.detail}")
+    path = request.scope["path"]
+    logger.warning("RATE LIMIT EXCEEDED: %s tried to access %s - %s", client_ip, path, exc.detail)
     
     AuditManager.log(
         request=request, 
         action="RATE_LIMIT_EXCEEDED", 
         severity="WARNING", 
-        details={"path": request.url.path, "limit": str(exc.detail)}
+        details={"path": path, "limit": str(exc.detail)}
     )
     
     # API / Auth endpoints -> JSON
-    if request.url.path.startswith("/api") or request.url.path.startswith("/auth"):
-         return JSONResponse(
+    if path.startswith(JSON_ERROR_PATH_PREFIXES):
+         return ORJSONResponse(
             {"success": False, "detail": f"Rate limit exceeded: {exc.detail}"}, 
             status_code=429
         )
@@ -165,11 +226,22 @@ configured_secret = os.getenv("ROXX_SECRET_KEY")
 security_profile.validate(configured_secret)
 SECRET_KEY = configured_secret or secrets.token_hex(32)
 
-from itsdangerous import URLSafeTimedSerializer
+from itsdangerous import BadData, URLSafeTimedSerializer
 cookie_signer = URLSafeTimedSerializer(SECRET_KEY, salt="roxx-mfa-trust")
 
+# Static assets and public probes never read the session: skip verifying
+# and decoding the cookie that browsers attach to every same-origin request
+SESSIONLESS_PATH_PREFIXES = ("/static/", "/livez", "/readyz", "/metrics")
+
+class _SessionMiddleware(SessionMiddleware):
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(SESSIONLESS_PATH_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 app.add_middleware(
-    SessionMiddleware,
+    _SessionMiddleware,
     secret_key=SECRET_KEY,
     max_age=3600,  # Session expires after 1 hour
     session_cookie="roxx_session",
@@ -177,12 +249,38 @@ app.add_middleware(
     same_site="lax"
 )
 
+# Compress HTML pages and JSON payloads (added last, so it wraps every other layer)
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
 # Templates directory
 templates_dir = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(templates_dir))
+# Templates ship with the package: only re-stat them for changes in development.
+# Compiled bytecode is kept in Jinja's per-user temp dir and reused across restarts.
+templates.env.auto_reload = security_profile.name == "development"
+templates.env.bytecode_cache = FileSystemBytecodeCache()
 
 # Static files
 static_dir = Path(__file__).parent / "static"
+
+# Content hashes of static assets, computed once per file
+_static_versions: dict = {}
+
+def static_url(path: str) -> str:
+    """URL of a static asset with a content-hash query so it can be cached forever"""
+    version = _static_versions.get(path)
+    if version is None:
+        try:
+            version = hashlib.blake2b((static_dir / path).read_bytes(), digest_size=6).hexdigest()
+        except OSError:
+            return f"/static/{path}"
+        # Development edits must produce a new URL without a restart
+        if not templates.env.auto_reload:
+            _static_versions[path] = version
+    return f"/static/{path}?v={version}"
+
+templates.env.globals["static_url"] = static_url
+
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
 from roxx.web.routes.observability import router as observability_router
@@ -234,18 +332,9 @@ async def get_current_username(request: Request):
     auth = get_auth_context(request)
     if auth and auth.get("username") and auth.get("status") == "active":
         return auth["username"]
-
-    # 2. Handle Unauthorized
-    accept = request.headers.get("Accept", "")
-    if "text/html" in accept:
-        raise NotAuthenticatedException()
-    else:
-        # API Response
-        raise HTTPException(
-            status_code=401,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Basic"},
-        )
+
+    # The exception handler picks a login redirect (HTML) or a 401 (API)
+    raise NotAuthenticatedException()
 
 
 def _rethrow_http_exception(exc: Exception) -> None:
@@ -353,8 +442,6 @@ async def _send_sms_login_code(request: Request, username: str) -> str:
 
 
 async def _send_email_login_code(request: Request, username: str) -> str:
-    from roxx.core.auth.email import EmailProvider
-
     email_address = AdminDatabase.get_email(username)
     if not email_address:
         raise HTTPException(status_code=400, detail="No email address configured")
@@ -392,24 +479,41 @@ async def not_authenticated_exception_handler(request: Request, exc: NotAuthenti
     if "text/html" in accept:
         return RedirectResponse(url="/login")
     else:
-        return JSONResponse(status_code=401, content={"detail": "Not authenticated"})
+        return ORJSONResponse(
+            status_code=401,
+            content={"detail": "Not authenticated"},
+        )
 
 
-@app.get("/login", response_class=HTMLResponse)
+# HTML of templates that use no context variables, rendered once per process
+_static_pages: dict = {}
+
+def _render_static_page(name: str) -> str:
+    html = _static_pages.get(name)
+    if html is None:
+        html = templates.get_template(name).render()
+        # Development edits must show up without a restart
+        if not templates.env.auto_reload:
+            _static_pages[name] = html
+    return html
+
+
+@app.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
-    return templates.TemplateResponse(request, "login.html", {"request": request})
+    # login.html is fully static: serve the pre-rendered page
+    return HTMLResponse(_render_static_page("login.html"))
 
 @app.post("/login")
 @limiter.limit("5/minute")
 async def login(request: Request, username: str = Form(...), password: str = Form(...)):
-    # Verify credentials
-    success, user_data = AuthManager.verify_credentials(username, password)
+    # Verify credentials (bcrypt runs on the KDF executor)
+    success, user_data = await run_kdf(AuthManager.verify_credentials, username, password)
     
     if success:
         # Check Force Change Password
         if user_data.get("must_change_password"):
             set_auth_context(request, username, "force_change")
-            response = JSONResponse({"success": True, "redirect": "/auth/change-password"})
+            response = ORJSONResponse({"success": True, "redirect": "/auth/change-password"})
             response.delete_cookie("session")
             return response
 
@@ -429,18 +533,16 @@ async def login(request: Request, username: str = Form(...), password: str = For
                 mfa_methods.append('sms')
             
         # 2. WebAuthn
-        from roxx.core.auth.webauthn_db import WebAuthnDatabase
         if WebAuthnDatabase.list_credentials(username):
             if 'webauthn' not in mfa_methods:
                 mfa_methods.append('webauthn')
                 
         # 3. Client Certs
-        from roxx.core.auth.cert_db import CertDatabase
         if CertDatabase.get_user_certs(username):
             if 'client_cert' not in mfa_methods:
                 mfa_methods.append('client_cert')
 
-        print(f"[DEBUG] Login for {username}: Methods={mfa_methods}, WebAuthnCreds={WebAuthnDatabase.list_credentials(username)}")
+        logger.debug("Login for %s: MFA methods=%s", username, mfa_methods)
 
         if mfa_methods:
             # Check Trusted Device
@@ -451,17 +553,18 @@ async def login(request: Request, username: str = Form(...), password: str = For
                     if trusted_username == username:
                         # Trusted - Skip MFA
                         set_auth_context(request, username, "active")
-                        response = JSONResponse({"success": True, "redirect": "/"})
+                        response = ORJSONResponse({"success": True, "redirect": "/"})
                         response.delete_cookie("session")
                         AuditManager.log(request, "LOGIN_SUCCESS", "INFO", {"username": username, "method": "trusted_device"}, username=username)
                         return response
-                except: pass
+                except BadData:
+                    pass
 
             # MFA Required
             request.session['mfa_username'] = username # Store for verification steps
             set_auth_context(request, username, "mfa_pending")
             
-            response = JSONResponse({
+            response = ORJSONResponse({
                 "success": True,
                 "mfa_required": True,
                 "username": username,
@@ -473,13 +576,13 @@ async def login(request: Request, username: str = Form(...), password: str = For
 
         # No MFA - Login
         user_role = set_auth_context(request, username, "active")["role"]
-        response = JSONResponse({"success": True, "redirect": "/dashboard"})
+        response = ORJSONResponse({"success": True, "redirect": "/dashboard"})
         response.delete_cookie("session")
         AuditManager.log(request, "LOGIN_SUCCESS", "INFO", {"username": username, "method": "password_only", "role": user_role}, username=username)
         return response
     
     AuditManager.log(request, "LOGIN_FAILED", "WARNING", {"username": username, "reason": "invalid_credentials"}, username=username)
-    return JSONResponse(status_code=401, content={"success": False, "detail": "Invalid credentials"})
+    return ORJSONResponse(status_code=401, content={"success": False, "detail": "Invalid credentials"})
 
 
 @app.get("/logout")
@@ -513,7 +616,7 @@ async def mfa_verify_unified(request: Request):
     """Unified MFA Verification (TOTP, SMS, Email, Backup)"""
     try:
         data = await request.json()
-    except:
+    except ValueError:
         raise HTTPException(status_code=400, detail="Invalid JSON")
         
     mfa_type = data.get('type')
@@ -552,7 +655,7 @@ async def mfa_verify_unified(request: Request):
              
     if verified:
         set_auth_context(request, username, "active")
-        response = JSONResponse({"success": True})
+        response = ORJSONResponse({"success": True})
         response.delete_cookie("session")
         
         # Cleanup
@@ -562,7 +665,7 @@ async def mfa_verify_unified(request: Request):
         return response
 
     AuditManager.log(request, "MFA_FAILED", "WARNING", {"username": username, "method": mfa_type, "reason": "invalid_code"}, username=username)
-    return JSONResponse({"success": False, "detail": "Invalid Code"}, status_code=400)
+    return ORJSONResponse({"success": False, "detail": "Invalid Code"}, status_code=400)
 
 
 @app.post("/auth/mfa/send-otp")
@@ -606,30 +709,27 @@ async def mfa_cert_verify(request: Request):
     """Verify Client Certificate for MFA"""
     # ... (Session Check as above) ...
     # Verify Cert
-    from roxx.core.security.cert_auth import CertAuthManager
-    from roxx.core.auth.cert_db import CertDatabase
-    
     auth = get_auth_context(request)
     if not auth or auth.get("status") != "mfa_pending":
-        return JSONResponse({"success": False, "detail": "Session Error"}, status_code=401)
+        return ORJSONResponse({"success": False, "detail": "Session Error"}, status_code=401)
     username = auth["username"]
 
     cert_info = CertAuthManager.get_cert_info(request)
     if not cert_info:
-         return JSONResponse({"success": False, "detail": "No Certificate"}, status_code=400)
+         return ORJSONResponse({"success": False, "detail": "No Certificate"}, status_code=400)
     
     # Check if this cert is registered to this user
     stored_user = CertDatabase.get_user_by_fingerprint(cert_info['fingerprint'])
     
     if stored_user and stored_user == username:
         set_auth_context(request, username, "active")
-        response = JSONResponse({"success": True})
+        response = ORJSONResponse({"success": True})
         response.delete_cookie("session")
         AuditManager.log(request, "MFA_SUCCESS", "INFO", {"username": username, "method": "client_cert", "fingerprint": cert_info['fingerprint']}, username=username)
         return response
         
     AuditManager.log(request, "MFA_FAILED", "WARNING", {"username": username, "method": "client_cert", "reason": "cert_mismatch", "fingerprint": cert_info['fingerprint']}, username=username)
-    return JSONResponse({"success": False, "detail": "Certificate not linked to user"}, status_code=403)
+    return ORJSONResponse({"success": False, "detail": "Certificate not linked to user"}, status_code=403)
 
 
 # ------------------------------------------------------------------------------
@@ -662,14 +762,14 @@ async def change_password(
             "request": request, "error": "New passwords do not match"
         })
 
-    success, _ = AuthManager.verify_credentials(username, current_password)
+    success, _ = await run_kdf(AuthManager.verify_credentials, username, current_password)
     if not success:
         return templates.TemplateResponse(request, "change_password.html", {
             "request": request, "error": "Current password incorrect"
         })
 
     try:
-        AuthManager.change_password(username, new_password)
+        await run_kdf(AuthManager.change_password, username, new_password)
     except ValueError as e:
          return templates.TemplateResponse(request, "change_password.html", {
             "request": request, "error": str(e)
@@ -704,32 +804,69 @@ async def mfa_challenge(request: Request, code: str = Form(...)):
         "request": request, "error": "Invalid authentication code"
     })
 
-@app.get("/auth/mfa-setup", response_class=HTMLResponse, dependencies=[Depends(get_current_username)])
-async def mfa_setup_page(request: Request):
-    username = await get_current_username(request)
+# Pending MFA setups keyed by a random nonce; only the nonce goes in the session
+# cookie, which is signed but not encrypted, so the TOTP secret stays server-side
+_MFA_SETUP_TTL = 600.0
+_MFA_SETUP_MAX = 1024
+_mfa_setup_pending: "OrderedDict[str, tuple[float, str, str, str]]" = OrderedDict()
+
+def _pending_mfa_setup(request: Request, username: str) -> Optional[Tuple[str, str]]:
+    """(secret, uri) of the caller's pending MFA setup, if it has not expired"""
+    now = time.monotonic()
+    # Entries share one TTL, so the oldest ones expire first
+    while _mfa_setup_pending and next(iter(_mfa_setup_pending.values()))[0] <= now:
+        _mfa_setup_pending.popitem(last=False)
+    entry = _mfa_setup_pending.get(request.session.get("mfa_setup_nonce", ""))
+    if entry is None or entry[1] != username:
+        return None
+    return entry[2], entry[3]
+
+def _start_mfa_setup(request: Request, username: str) -> Tuple[str, str]:
     secret, uri = AuthManager.setup_mfa(username)
-    
-    # Check if we have 'qrcode' lib support for image generation
-    # If not, client side JS or just display secret
-    # roxx requirements has qrcode.
-    img = qrcode.make(uri)
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    qr_b64 = base64.b64encode(buf.getvalue()).decode('utf-8')
-    
+    _mfa_setup_pending.pop(request.session.get("mfa_setup_nonce", ""), None)
+    nonce = secrets.token_urlsafe(16)
+    _mfa_setup_pending[nonce] = (time.monotonic() + _MFA_SETUP_TTL, username, secret, uri)
+    while len(_mfa_setup_pending) > _MFA_SETUP_MAX:
+        _mfa_setup_pending.popitem(last=False)
+    request.session["mfa_setup_nonce"] = nonce
+    return secret, uri
+
+@app.get("/auth/mfa-setup", response_class=HTMLResponse)
+async def mfa_setup_page(request: Request, username: str = Depends(get_current_username)):
+    # Reloads of the setup page keep the same pending secret (and so the same QR)
+    secret, uri = _pending_mfa_setup(request, username) or _start_mfa_setup(request, username)
+    
+    # The QR is fetched separately from /auth/mfa-setup/qr.svg instead of being inlined as base64
     return templates.TemplateResponse(request, "mfa_setup.html", {
         "request": request, 
         "secret": secret,
-        "qr_b64": qr_b64
     })
+
+@app.get("/auth/mfa-setup/qr.svg")
+async def mfa_setup_qr(request: Request, username: str = Depends(get_current_username)):
+    """QR image for the pending MFA setup secret"""
+    pending = _pending_mfa_setup(request, username)
+    if pending is None:
+        raise HTTPException(status_code=404, detail="No pending MFA setup")
+    return Response(
+        MFAManager.render_qr_svg(pending[1]),
+        media_type="image/svg+xml",
+        # The image encodes the TOTP secret
+        headers={"Cache-Control": "no-store"},
+    )
 
-@app.post("/auth/mfa-setup", response_class=HTMLResponse, dependencies=[Depends(get_current_username)])
-async def mfa_setup(request: Request, secret: str = Form(...), code: str = Form(...)):
-    username = await get_current_username(request)
+@app.post("/auth/mfa-setup", response_class=HTMLResponse)
+async def mfa_setup(
+    request: Request,
+    secret: str = Form(...),
+    code: str = Form(...),
+    username: str = Depends(get_current_username),
+):
     
     # Verify code against the NEW secret
     if AuthManager.verify_mfa(username, code, pending_secret=secret):
         AuthManager.enable_mfa(username, secret)
+        _mfa_setup_pending.pop(request.session.pop("mfa_setup_nonce", ""), None)
         return RedirectResponse(url="/", status_code=303)
     
     # Error handling? Need to re-generate QR? 
@@ -782,7 +919,7 @@ async def webauthn_auth_verify(request: Request):
     if success:
         if request.session.get('mfa_username'):
              set_auth_context(request, username, "active")
-             response = JSONResponse({"success": True, "redirect": "/"})
+             response = ORJSONResponse({"success": True, "redirect": "/"})
              response.delete_cookie("session")
              request.session.pop('mfa_username', None)
              return response
@@ -817,8 +954,6 @@ def get_page_context(request: Request, username: str, active_page: str, **kwargs
 
 def get_system_settings_snapshot() -> dict:
     """Return system settings merged with sane defaults."""
-    from roxx.core.auth.config_db import ConfigManager
-
     defaults = {
         "server_name": "RoXX RADIUS Proxy",
         "radius_auth_port": "1812",
@@ -852,7 +987,7 @@ async def home(request: Request):
     return RedirectResponse("/dashboard")
 
 
-@app.get("/totp/enroll", response_class=HTMLResponse, dependencies=[Depends(get_current_username)])
+@app.get("/totp/enroll", response_class=HTMLResponse)
 async def totp_enroll_page(request: Request, current_user: str = Depends(get_current_username)):
     """TOTP enrollment page"""
     return templates.TemplateResponse(request, "totp_enroll.html", get_page_context(
@@ -878,7 +1013,6 @@ async def api_nps_analyze(request: Request, file: UploadFile = File(...)):
     """API to analyze NPS XML file"""
     try:
         content = await file.read()
-        from roxx.utils.nps_importer import NPSImporter
         results = NPSImporter.parse_xml(content.decode("utf-8"))
         
         # Mask secrets for UI display
@@ -910,8 +1044,6 @@ async def api_nps_import(request: Request):
     selected_servers = set(selection.get("selected_servers", []))
     server_secrets = selection.get("server_secrets", {})
     
-    from roxx.core.radius_backends.config_db import RadiusBackendDB
-    
     import_count = 0
     # Import Clients
     for client in buffered_data.get("clients", []):
@@ -957,7 +1089,6 @@ async def api_nps_import(request: Request):
 @app.get("/api/health/backends", dependencies=[Depends(require_action(Action.VIEW_SYSTEM_INFO))])
 async def get_backend_health():
     """Returns actual status of authentication backends"""
-    from roxx.core.health import HealthManager
     return await HealthManager.get_backend_status()
 
 @app.get("/api/metrics/auth", dependencies=[Depends(require_action(Action.VIEW_DASHBOARD))])
@@ -965,9 +1096,6 @@ async def get_auth_metrics(period_hours: int = 24, granularity: str = "hour"):
     """
     Returns authentication success/failure metrics for the selected time window.
     """
-    from roxx.core.audit.db import AuditDatabase
-    from collections import defaultdict
-
     if period_hours not in (1, 24):
         raise HTTPException(status_code=400, detail="Unsupported period_hours")
     if granularity not in ("hour", "minute"):
@@ -1047,12 +1175,25 @@ async def get_auth_metrics(period_hours: int = 24, granularity: str = "hour"):
 @app.get("/dashboard", response_class=HTMLResponse, dependencies=[Depends(require_action(Action.VIEW_DASHBOARD))])
 async def dashboard(request: Request, current_user: str = Depends(get_current_username)):
     """Dashboard page"""
-    import logging # Added for logger.error
-    
-    logger = logging.getLogger(__name__) # Initialize logger
-    
+    cached = _dashboard_cache.get("context")
+    if cached is not None and cached[0] > time.monotonic():
+        context = cached[1]
+    else:
+        context = await asyncio.to_thread(_dashboard_context)
+        _dashboard_cache["context"] = (time.monotonic() + _DASHBOARD_TTL, context)
+    return templates.TemplateResponse(request, "dashboard.html", get_page_context(
+        request, current_user, "dashboard", **context
+    ))
+
+
+# Auto-refreshing dashboards share one snapshot of the probes below for a couple of seconds
+_DASHBOARD_TTL = 2.0
+_dashboard_cache: dict = {}
+
+def _dashboard_context() -> dict:
+    """Blocking /proc, service and admin DB reads behind the dashboard page"""
     # Check FreeRADIUS status
-    radius_active = SystemManager.is_service_running('freeradius') or SystemManager.is_service_running('radiusd')
+    radius_active = SystemManager.is_service_running('freeradius', 'radiusd')
     radius_status = "UP" if radius_active else "DOWN"
     
     # Fetch recent users/admins for the user management table
@@ -1072,8 +1213,7 @@ async def dashboard(request: Request, current_user: str = Depends(get_current_us
             {"username": "admin", "role": "Local", "status": "UP", "last_login": "2024-05-22"}
         ]
     
-    return templates.TemplateResponse(request, "dashboard.html", get_page_context(
-        request, current_user, "dashboard",
+    return dict(
         radius_status=radius_status,
         os_type=SystemManager.get_os(),
         kernel_version=SystemManager.get_kernel_version(),
@@ -1083,24 +1223,49 @@ async def dashboard(request: Request, current_user: str = Depends(get_current_us
         disk=SystemManager.get_disk_info(),
         adv=SystemManager.get_advanced_metrics(),
         recent_users=recent_users
-    ))
+    )
+
+
+# "username attribute op password" lines (at least four fields) of users.conf
+_USER_ENTRY_RE = re.compile(
+    rb'^[^\S\n]*([^#\s]\S*)[^\S\n]+(\S+)[^\S\n]+(\S+)[^\S\n]+(\S+)', re.MULTILINE
+)
+
+@functools.lru_cache(maxsize=8)
+def _parse_user_entries(path: str, mtime_ns: int, size: int, inode: int) -> Tuple[dict, ...]:
+    """RADIUS user entries in users.conf; the stat fields in the key invalidate stale entries"""
+    if not size:
+        return ()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return tuple(
+            {
+                "username": username.decode('utf-8', 'replace'),
+                "attribute": attribute.decode('utf-8', 'replace'),
+                "op": op.decode('utf-8', 'replace'),
+                "password": password.decode('utf-8', 'replace').strip('"'),
+            }
+            for username, attribute, op, password in _USER_ENTRY_RE.findall(mm)
+        )
+
+
+def _read_user_entries(users_file: Path) -> Tuple[dict, ...]:
+    """Stat users.conf and only re-parse it when it changed"""
+    try:
+        st = os.stat(users_file)
+    except FileNotFoundError:
+        return ()
+    return _parse_user_entries(str(users_file), st.st_mtime_ns, st.st_size, st.st_ino)
 
 
-@app.get("/users", response_class=HTMLResponse, dependencies=[Depends(require_action(Action.MANAGE_RADIUS_USERS))])
-async def users_page(request: Request, current_user: str = Depends(get_current_username)):
-    """User management page"""
-    # Simple parse of users.conf if it exists
+@app.get("/users", response_class=HTMLResponse, dependencies=[Depends(require_action(Action.MANAGE_RADIUS_USERS))])
+async def users_page(request: Request, current_user: str = Depends(get_current_username)):
+    """User management page"""
+    # Simple parse of users.conf if it exists (off the event loop)
     users_list = []
     try:
         users_file = SystemManager.get_config_dir() / "users.conf"
-        if users_file.exists():
-            with open(users_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        parts = line.split()
-                        if parts:
-                            users_list.append(parts[0])
+        entries = await asyncio.to_thread(_read_user_entries, users_file)
+        users_list = [entry["username"] for entry in entries]
     except Exception:
         pass
         
@@ -1111,25 +1276,10 @@ async def users_page(request: Request, current_user: str = Depends(get_current_u
 
 
 @app.get("/api/users", dependencies=[Depends(require_action(Action.MANAGE_RADIUS_USERS))])
-async def get_radius_users():
-    """List local RADIUS users from users.conf."""
+def get_radius_users():
+    """List local RADIUS users from users.conf (sync: FastAPI runs it in the threadpool)."""
     users_file = SystemManager.get_config_dir() / "users.conf"
-    users = []
-    if users_file.exists():
-        with open(users_file, "r") as f:
-            for line in f:
-                stripped = line.strip()
-                if not stripped or stripped.startswith('#'):
-                    continue
-                parts = stripped.split()
-                if len(parts) >= 4:
-                    users.append({
-                        "username": parts[0],
-                        "attribute": parts[1],
-                        "op": parts[2],
-                        "password": parts[3].strip('"')
-                    })
-    return users
+    return [dict(entry) for entry in _read_user_entries(users_file)]
 
 
 @app.post("/api/users", dependencies=[Depends(require_action(Action.MANAGE_RADIUS_USERS))])
@@ -1137,14 +1287,14 @@ async def add_radius_user(request: Request):
     data = await request.json()
     username = data.get("username")
     password = data.get("password")
-    if SystemManager.add_radius_user(username, password):
+    if await asyncio.to_thread(SystemManager.add_radius_user, username, password):
         return {"success": True}
     return {"success": False}
 
 
 @app.delete("/api/users/{username}", dependencies=[Depends(require_action(Action.MANAGE_RADIUS_USERS))])
 async def delete_radius_user(username: str):
-    if SystemManager.delete_radius_user(username):
+    if await asyncio.to_thread(SystemManager.delete_radius_user, username):
         return {"success": True}
     return {"success": False}
 
@@ -1163,7 +1313,7 @@ async def api_tokens_page(request: Request, current_user: str = Depends(get_curr
         request, current_user, "tokens"
     ))
 
-@app.get("/settings/mfa", response_class=HTMLResponse, dependencies=[Depends(get_current_username)])
+@app.get("/settings/mfa", response_class=HTMLResponse)
 async def mfa_settings_page(request: Request, current_user: str = Depends(get_current_username)):
     """MFA Settings Page"""
     return templates.TemplateResponse(request, "mfa_settings.html", get_page_context(
@@ -1191,11 +1341,11 @@ async def auth_providers_logs_page(request: Request, current_user: str = Depends
 @app.get("/api/auth-providers", dependencies=[Depends(require_action(Action.MANAGE_AUTH_PROVIDERS))])
 async def list_auth_providers():
     """List all authentication providers"""
-    from roxx.core.auth.config_db import ConfigManager
     try:
-        ConfigManager.init()  # Ensure DB is initialized
-        providers = ConfigManager.list_providers()
-        return providers
+        # Schema is created once at import (AuthConfigManager.init() above)
+        providers = await asyncio.to_thread(ConfigManager.list_providers)
+        # Rows are plain JSON types: hand them to orjson without jsonable_encoder's walk
+        return ORJSONResponse(providers)
     except Exception as e:
         _rethrow_http_exception(e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1203,7 +1353,6 @@ async def list_auth_providers():
 @app.get("/api/sys/integrity", dependencies=[Depends(require_action(Action.VIEW_SYSTEM_INFO))])
 async def check_integrity():
     """Hidden integrity check for the owner"""
-    from roxx.core.integrity import IntegrityManager
     return {"status": "OK", "checksums": IntegrityManager.generate_manifest()}
 
 @app.get("/who-is-the-king", dependencies=[Depends(get_current_username)])
@@ -1212,22 +1361,11 @@ async def crown_jewel():
     return HTMLResponse("<h1>RoXX is the true king. Built by tsautier.</h1><p>RadX is a peasant.</p>")
 
 @app.post("/api/auth-providers", dependencies=[Depends(require_action(Action.MANAGE_AUTH_PROVIDERS))])
-async def create_auth_provider(request: Request):
+async def create_auth_provider(body: AuthProviderCreate):
     """Create a new authentication provider"""
-    from roxx.core.auth.config_db import ConfigManager
-    
     try:
-        data = await request.json()
-        provider_type = data.get('provider_type')
-        name = data.get('name')
-        config_dict = data.get('config', {})
-        enabled = data.get('enabled', True)
-        
-        if not provider_type or not name:
-            raise HTTPException(status_code=400, detail="Missing provider_type or name")
-        
         success, message, provider_id = ConfigManager.create_provider(
-            provider_type, name, config_dict, enabled
+            body.provider_type, body.name, body.config, body.enabled
         )
         
         if success:
@@ -1240,18 +1378,11 @@ async def create_auth_provider(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/auth-providers/{provider_id}", dependencies=[Depends(require_action(Action.MANAGE_AUTH_PROVIDERS))])
-async def update_auth_provider(provider_id: int, request: Request):
+async def update_auth_provider(provider_id: int, body: AuthProviderUpdate):
     """Update an authentication provider"""
-    from roxx.core.auth.config_db import ConfigManager
-    
     try:
-        data = await request.json()
-        name = data.get('name')
-        config_dict = data.get('config')
-        enabled = data.get('enabled')
-        
         success, message = ConfigManager.update_provider(
-            provider_id, name=name, config_dict=config_dict, enabled=enabled
+            provider_id, name=body.name, config_dict=body.config, enabled=body.enabled
         )
         
         if success:
@@ -1266,8 +1397,6 @@ async def update_auth_provider(provider_id: int, request: Request):
 @app.delete("/api/auth-providers/{provider_id}", dependencies=[Depends(require_action(Action.MANAGE_AUTH_PROVIDERS))])
 async def delete_auth_provider(provider_id: int):
     """Delete an authentication provider"""
-    from roxx.core.auth.config_db import ConfigManager
-    
     try:
         success, message = ConfigManager.delete_provider(provider_id)
         
@@ -1281,22 +1410,11 @@ async def delete_auth_provider(provider_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/auth-providers/test", dependencies=[Depends(require_action(Action.MANAGE_AUTH_PROVIDERS))])
-async def test_auth_provider(request: Request):
+async def test_auth_provider(body: AuthProviderTest):
     """Test authentication provider configuration"""
-    from roxx.core.auth.config_db import ConfigManager
-    
     try:
-        data = await request.json()
-        provider_type = data.get('provider_type')
-        config_dict = data.get('config', {})
-        test_username = data.get('test_username')
-        test_password = data.get('test_password')
-        
-        if not all([provider_type, test_username, test_password]):
-            raise HTTPException(status_code=400, detail="Missing required fields")
-        
         success, message = ConfigManager.test_provider(
-            provider_type, config_dict, test_username, test_password
+            body.provider_type, body.config, body.test_username, body.test_password
         )
         
         return {"success": success, "message": message}
@@ -1326,39 +1444,25 @@ async def radius_backends_logs_page(request: Request, current_user: str = Depend
 @app.get("/api/radius-backends", dependencies=[Depends(require_action(Action.MANAGE_RADIUS_BACKENDS))])
 async def list_radius_backends():
     """List all RADIUS backends"""
-    from roxx.core.radius_backends.config_db import RadiusBackendDB
     try:
-        RadiusBackendDB.init()
-        backends = RadiusBackendDB.list_backends()
-        return backends
+        # Schema is created once at import (RadiusBackendDB.init() above)
+        backends = await asyncio.to_thread(RadiusBackendDB.list_backends)
+        return ORJSONResponse(backends)
     except Exception as e:
         _rethrow_http_exception(e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/radius-backends", dependencies=[Depends(require_action(Action.MANAGE_RADIUS_BACKENDS))])
-async def create_radius_backend(request: Request):
+async def create_radius_backend(body: RadiusBackendCreate):
     """Create a new RADIUS backend"""
-    from roxx.core.radius_backends.config_db import RadiusBackendDB
-    
     try:
-        data = await request.json()
-        backend_type = data.get('backend_type')
-        name = data.get('name')
-        config_dict = data.get('config', {})
-        enabled = data.get('enabled', True)
-        priority = data.get('priority', 100)
-        
-        if not backend_type or not name:
-            raise HTTPException(status_code=400, detail="Missing backend_type or name")
-        
         success, message, backend_id = RadiusBackendDB.create_backend(
-            backend_type, name, config_dict, enabled, priority
+            body.backend_type, body.name, body.config, body.enabled, body.priority
         )
         
         if success:
             # Reload backends in manager
-            from roxx.core.radius_backends.manager import reload_manager
-            reload_manager()
+            radius_backend_manager.reload_manager()
             return {"success": True, "message": message, "id": backend_id}
         else:
             raise HTTPException(status_code=400, detail=message)
@@ -1368,26 +1472,17 @@ async def create_radius_backend(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.put("/api/radius-backends/{backend_id}", dependencies=[Depends(require_action(Action.MANAGE_RADIUS_BACKENDS))])
-async def update_radius_backend(backend_id: int, request: Request):
+async def update_radius_backend(backend_id: int, body: RadiusBackendUpdate):
     """Update a RADIUS backend"""
-    from roxx.core.radius_backends.config_db import RadiusBackendDB
-    
     try:
-        data = await request.json()
-        name = data.get('name')
-        config_dict = data.get('config')
-        enabled = data.get('enabled')
-        priority = data.get('priority')
-        
-        success, message = RadiusBackendDB.update_backend(
-            backend_id, name=name, config=config_dict,
-            enabled=enabled, priority=priority
+        success, message = RadiusBackendDB.update_backend(
+            backend_id, name=body.name, config=body.config,
+            enabled=body.enabled, priority=body.priority
         )
         
         if success:
             # Reload backends in manager
-            from roxx.core.radius_backends.manager import reload_manager
-            reload_manager()
+            radius_backend_manager.reload_manager()
             return {"success": True, "message": message}
         else:
             raise HTTPException(status_code=400, detail=message)
@@ -1399,15 +1494,12 @@ async def update_radius_backend(backend_id: int, request: Request):
 @app.delete("/api/radius-backends/{backend_id}", dependencies=[Depends(require_action(Action.MANAGE_RADIUS_BACKENDS))])
 async def delete_radius_backend(backend_id: int):
     """Delete a RADIUS backend"""
-    from roxx.core.radius_backends.config_db import RadiusBackendDB
-    
     try:
         success, message = RadiusBackendDB.delete_backend(backend_id)
         
         if success:
             # Reload backends in manager
-            from roxx.core.radius_backends.manager import reload_manager
-            reload_manager()
+            radius_backend_manager.reload_manager()
             return {"success": True, "message": message}
         else:
             raise HTTPException(status_code=400, detail=message)
@@ -1417,20 +1509,11 @@ async def delete_radius_backend(backend_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/radius-backends/test", dependencies=[Depends(require_action(Action.MANAGE_RADIUS_BACKENDS))])
-async def test_radius_backend(request: Request):
+async def test_radius_backend(body: RadiusBackendTest):
     """Test RADIUS backend configuration"""
-    from roxx.core.radius_backends.manager import RadiusBackendManager
-    
     try:
-        data = await request.json()
-        backend_type = data.get('backend_type')
-        config_dict = data.get('config', {})
-        test_username = data.get('test_username')
-        test_password = data.get('test_password')
-        
-        manager = RadiusBackendManager()
-        success, message = manager.test_backend(
-            backend_type, config_dict, test_username, test_password
+        success, message = RadiusBackendManager.test_backend(
+            body.backend_type, body.config, body.test_username, body.test_password
         )
         
         return {"success": success, "message": message}
@@ -1440,23 +1523,14 @@ async def test_radius_backend(request: Request):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/radius-auth", dependencies=[Depends(get_current_username)])
-async def radius_authenticate(request: Request):
+async def radius_authenticate(body: RadiusAuthRequest):
     """
     RADIUS authentication endpoint (for REST API integration).
     Used by FreeRADIUS rlm_rest or external systems.
     """
-    from roxx.core.radius_backends.manager import get_manager
-    
     try:
-        data = await request.json()
-        username = data.get('username')
-        password = data.get('password')
-        
-        if not username or not password:
-            raise HTTPException(status_code=400, detail="Missing username or password")
-        
-        manager = get_manager()
-        success, attributes = manager.authenticate(username, password)
+        manager = radius_backend_manager.get_manager()
+        success, attributes = manager.authenticate(body.username, body.password)
         
         if success:
             return {
@@ -1520,8 +1594,8 @@ async def integration_tools_page(request: Request, current_user: str = Depends(g
 @app.get("/api/tokens", dependencies=[Depends(require_action(Action.MANAGE_API_TOKENS))])
 async def list_api_tokens():
     """List all API tokens (admin only)"""
-    tokens = APITokenManager.list_tokens()
-    return {"tokens": tokens}
+    tokens = await asyncio.to_thread(APITokenManager.list_tokens)
+    return ORJSONResponse({"tokens": tokens})
 
 @app.post("/api/tokens", dependencies=[Depends(require_action(Action.MANAGE_API_TOKENS))])
 async def generate_api_token(request: Request):
@@ -1557,13 +1631,13 @@ async def revoke_api_token(token_id: int, hard_delete: bool = False):
 @app.get("/api/system/info", dependencies=[Depends(require_action(Action.VIEW_SYSTEM_INFO))])
 async def system_info():
     """Get system information"""
-    return JSONResponse({
+    return {
         "os": SystemManager.get_os(),
         "is_admin": SystemManager.is_admin(),
         "config_dir": str(SystemManager.get_config_dir()),
         "uptime": SystemManager.get_uptime(),
         "version": VERSION
-    })
+    }
 
 
 
@@ -1579,7 +1653,7 @@ async def health_check():
 @app.get("/admins", response_class=HTMLResponse, dependencies=[Depends(require_action(Action.MANAGE_ADMINS))])
 async def admins_page(request: Request, current_user: str = Depends(get_current_username)):
     """Admin management page"""
-    admins_list = AuthManager.list_admins()
+    admins_list = await asyncio.to_thread(AuthManager.list_admins)
     
     return templates.TemplateResponse(request, "admins.html", get_page_context(
         request, current_user, "admins",
@@ -1601,7 +1675,7 @@ async def create_admin(
     if role not in ('superadmin', 'admin', 'auditor'):
         raise HTTPException(status_code=400, detail=f"Invalid role: {role}")
     
-    success, message = AuthManager.create_admin(username, password, auth_source, role=role)
+    success, message = await run_kdf(AuthManager.create_admin, username, password, auth_source, role=role)
     if success:
         return {"success": True, "message": message}
     else:
@@ -1630,7 +1704,6 @@ async def change_admin_role(username: str, request: Request, current_user: str =
     if new_role not in ('superadmin', 'admin', 'auditor'):
         raise HTTPException(status_code=400, detail=f"Invalid role: {new_role}")
     
-    from roxx.core.auth.db import AdminDatabase
     if AdminDatabase.set_role(username, new_role):
         AuditManager.log(request, "ROLE_CHANGED", "INFO", {"target": username, "new_role": new_role}, username=current_user)
         return {"success": True, "message": f"Role changed to {new_role}"}
@@ -1650,11 +1723,9 @@ async def admin_mfa_page(username: str, request: Request, current_user: str = De
 @app.get("/api/admins/{username}/mfa/credentials", dependencies=[Depends(require_action(Action.MANAGE_MFA))])
 async def list_user_mfa_credentials(username: str):
     """List all WebAuthn credentials for a user"""
-    from roxx.core.auth.webauthn_db import WebAuthnDatabase
     try:
         creds = WebAuthnDatabase.list_credentials(username)
         # Convert binary fields to base64 for JSON serialization
-        import base64
         for cred in creds:
             if 'credential_id' in cred and isinstance(cred['credential_id'], bytes):
                 cred['credential_id'] = base64.b64encode(cred['credential_id']).decode('utf-8')
@@ -1668,7 +1739,6 @@ async def list_user_mfa_credentials(username: str):
 @app.delete("/api/admins/{username}/mfa/webauthn/{credential_id}", dependencies=[Depends(require_action(Action.MANAGE_MFA))])
 async def delete_webauthn_credential(username: str, credential_id: int):
     """Delete a specific WebAuthn credential"""
-    from roxx.core.auth.webauthn_db import WebAuthnDatabase
     try:
         success = WebAuthnDatabase.delete_credential(credential_id, username)
         if success:
@@ -1682,7 +1752,6 @@ async def delete_webauthn_credential(username: str, credential_id: int):
 @app.post("/api/admins/{username}/mfa/totp/reset", dependencies=[Depends(require_action(Action.MANAGE_MFA))])
 async def reset_user_totp(username: str):
     """Reset TOTP MFA for a user"""
-    from roxx.core.auth.db import AdminDatabase
     try:
         success = AdminDatabase.reset_totp(username)
         if success:
@@ -1696,8 +1765,6 @@ async def reset_user_totp(username: str):
 @app.get("/api/admins/{username}/mfa/status", dependencies=[Depends(require_action(Action.MANAGE_MFA))])
 async def get_user_mfa_status(username: str):
     """Get MFA status for a user"""
-    from roxx.core.auth.db import AdminDatabase
-    from roxx.core.auth.webauthn_db import WebAuthnDatabase
     try:
         totp_status = AdminDatabase.get_mfa_status(username)
         webauthn_creds = WebAuthnDatabase.list_credentials(username)
@@ -1714,7 +1781,6 @@ async def get_user_mfa_status(username: str):
 @app.get("/api/admins/{username}/mfa/webauthn/register/options", dependencies=[Depends(require_action(Action.MANAGE_MFA))])
 async def admin_webauthn_register_options(request: Request, username: str):
     """Get WebAuthn registration options for an admin"""
-    from roxx.core.auth.webauthn import WebAuthnManager
     options, state = WebAuthnManager.generate_registration_options(username, username, rp_id=request.url.hostname)
     request.session[f"webauthn_reg_state_{username}"] = state
     
@@ -1744,7 +1810,6 @@ async def admin_webauthn_register_verify(request: Request, username: str):
     if not state:
         raise HTTPException(status_code=400, detail="Registration state not found")
     
-    from roxx.core.auth.webauthn import WebAuthnManager
     success, msg = WebAuthnManager.verify_registration(username, data, state, rp_id=request.url.hostname)
     if success:
         request.session.pop(f"webauthn_reg_state_{username}", None)
@@ -1755,32 +1820,29 @@ async def admin_webauthn_register_verify(request: Request, username: str):
 # Real-time Logs (WebSocket)
 # ------------------------------------------------------------------------------
 
-# Track active WebSocket connections for log streaming
-active_log_websockets: List[WebSocket] = []
-
+# Legacy Basic Auth credentials for the log WebSocket, digested once at import
+_BASIC_AUTH_USER_DIGEST = hashlib.sha256(os.getenv("ROXX_ADMIN_USER", "admin").encode("utf-8")).digest()
+_BASIC_AUTH_PASS_DIGEST = hashlib.sha256(os.getenv("ROXX_ADMIN_PASSWORD", "admin").encode("utf-8")).digest()
+
 async def get_current_username_ws(websocket: WebSocket):
     """Require an authenticated WebSocket session, with legacy Basic Auth fallback."""
     auth = get_auth_context(websocket)
     if auth and auth.get("username") and auth.get("status") == "active":
         return auth["username"]
 
-    auth_header = websocket.headers.get("authorization")
-    if not auth_header:
-        return None
-
-    try:
-        scheme, param = auth_header.split()
-        if scheme.lower() != "basic":
-            return None
-        decoded = base64.b64decode(param).decode("utf-8")
-        username,password = decoded.split(":")
-        
-        correct_username = os.getenv("ROXX_ADMIN_USER", "admin")
-        correct_password = os.getenv("ROXX_ADMIN_PASSWORD", "admin")
+    auth_header = websocket.headers.get("authorization")
+    if not auth_header or auth_header[:6].lower() != "basic ":
+        return None
+
+    try:
+        username, _, password = binascii.a2b_base64(auth_header[6:]).partition(b":")
         
-        if secrets.compare_digest(username, correct_username) and secrets.compare_digest(password, correct_password):
-            return username
-    except:
+        # Fixed-length digest comparisons against the values digested at import
+        user_ok = hmac.compare_digest(hashlib.sha256(username).digest(), _BASIC_AUTH_USER_DIGEST)
+        pass_ok = hmac.compare_digest(hashlib.sha256(password).digest(), _BASIC_AUTH_PASS_DIGEST)
+        if user_ok and pass_ok:
+            return username.decode("utf-8")
+    except (binascii.Error, ValueError, UnicodeDecodeError):
         return None
     return None
 
@@ -1791,16 +1853,33 @@ async def websocket_endpoint(websocket: WebSocket):
         await websocket.close(code=1008)
         return
 
-    await websocket.accept()
-    active_log_websockets.append(websocket)
-    try:
-        await websocket.send_text("Connected to Real-Time System Logs...")
+    await websocket.accept()
+    queue = log_broadcaster.subscribe()
+
+    async def forward_logs():
+        while True:
+            await websocket.send_text(await log_broadcaster.next_batch(queue))
+
+    async def drain_client():
+        # Returns (via WebSocketDisconnect) when the client goes away
         while True:
-            # Keep connection alive
             await websocket.receive_text()
-    except:
-        if websocket in active_log_websockets:
-            active_log_websockets.remove(websocket)
+
+    tasks = []
+    try:
+        await websocket.send_text("Connected to Real-Time System Logs...")
+        tasks = [asyncio.create_task(forward_logs()), asyncio.create_task(drain_client())]
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in tasks:
+            if task.done():
+                if not task.cancelled():
+                    task.exception()  # disconnect or send failure: consumed, nothing to report
+            else:
+                task.cancel()
+        log_broadcaster.unsubscribe(queue)
 
 # ------------------------------------------------------------------------------
 # MFA API Endpoints (Self-Service)
@@ -1808,10 +1887,9 @@ async def websocket_endpoint(websocket: WebSocket):
 from roxx.core.auth.mfa import MFAManager
 from roxx.core.auth.mfa_db import MFADatabase
 
-@app.get("/api/webauthn/list", dependencies=[Depends(get_current_username)])
+@app.get("/api/webauthn/list")
 async def webauthn_list_self(username: str = Depends(get_current_username)):
     """List WebAuthn credentials for current user"""
-    from roxx.core.auth.webauthn_db import WebAuthnDatabase
     try:
         creds = WebAuthnDatabase.list_credentials(username)
         return {"credentials": creds}
@@ -1819,10 +1897,9 @@ async def webauthn_list_self(username: str = Depends(get_current_username)):
         logger.error(f"Error listing self credentials: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/webauthn/register/options", dependencies=[Depends(get_current_username)])
+@app.get("/api/webauthn/register/options")
 async def webauthn_register_options(request: Request, username: str = Depends(get_current_username)):
     """Registration options for self-service"""
-    from roxx.core.auth.webauthn import WebAuthnManager
     options, state = WebAuthnManager.generate_registration_options(username, username, rp_id=request.url.hostname)
     request.session[f"webauthn_reg_state_{username}"] = state
     
@@ -1845,7 +1922,7 @@ async def webauthn_register_options(request: Request, username: str = Depends(ge
         }
     }
 
-@app.post("/api/webauthn/register/verify", dependencies=[Depends(get_current_username)])
+@app.post("/api/webauthn/register/verify")
 async def webauthn_register_verify(request: Request, username: str = Depends(get_current_username)):
     """Verify registration for self-service"""
     data = await request.json()
@@ -1853,7 +1930,6 @@ async def webauthn_register_verify(request: Request, username: str = Depends(get
     if not state:
         raise HTTPException(status_code=400, detail="Registration state not found")
     
-    from roxx.core.auth.webauthn import WebAuthnManager
     success, msg = WebAuthnManager.verify_registration(username, data, state, rp_id=request.url.hostname)
     if success:
         request.session.pop(f"webauthn_reg_state_{username}", None)
@@ -1863,7 +1939,6 @@ async def webauthn_register_verify(request: Request, username: str = Depends(get
 @app.delete("/api/webauthn/{credential_id}", dependencies=[Depends(require_action(Action.MANAGE_MFA))])
 async def delete_webauthn_self(credential_id: int, username: str = Depends(get_current_username)):
     """Delete a WebAuthn credential for current user"""
-    from roxx.core.auth.webauthn_db import WebAuthnDatabase
     try:
         if WebAuthnDatabase.delete_credential(credential_id, username):
             return {"success": True}
@@ -1872,7 +1947,7 @@ async def delete_webauthn_self(credential_id: int, username: str = Depends(get_c
         logger.error(f"Error deleting credential: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/mfa/enroll", dependencies=[Depends(get_current_username)])
+@app.post("/api/mfa/enroll")
 async def mfa_enroll(request: Request, username: str = Depends(get_current_username)):
     """Start MFA enrollment for current user"""
     secret = MFAManager.generate_secret()
@@ -1892,7 +1967,7 @@ async def mfa_enroll(request: Request, username: str = Depends(get_current_usern
         "backup_codes": plain_codes
     }
 
-@app.post("/api/mfa/verify-enrollment", dependencies=[Depends(get_current_username)])
+@app.post("/api/mfa/verify-enrollment")
 async def mfa_verify_enrollment(request: Request, token: str = Form(...), username: str = Depends(get_current_username)):
     """Verify TOTP token and complete enrollment"""
     enrollment = request.session.get('mfa_enrollment')
@@ -1909,7 +1984,7 @@ async def mfa_verify_enrollment(request: Request, token: str = Form(...), userna
     raise HTTPException(status_code=500, detail=message)
 
 
-@app.put("/api/mfa/phone", dependencies=[Depends(get_current_username)])
+@app.put("/api/mfa/phone")
 async def save_mfa_phone(request: Request, username: str = Depends(get_current_username)):
     """Save or clear the current user's SMS phone number."""
     data = await request.json()
@@ -1934,7 +2009,7 @@ async def save_mfa_phone(request: Request, username: str = Depends(get_current_u
     }
 
 
-@app.get("/api/mfa/status", dependencies=[Depends(get_current_username)])
+@app.get("/api/mfa/status")
 async def mfa_status(request: Request, username: str = Depends(get_current_username)):
     """Get MFA status for current user"""
     settings = MFADatabase.get_mfa_settings(username)
@@ -1963,7 +2038,7 @@ async def mfa_status(request: Request, username: str = Depends(get_current_usern
         "methods": ["sms"] if sms_enabled else [],
     }
 
-@app.post("/api/mfa/disable", dependencies=[Depends(get_current_username)])
+@app.post("/api/mfa/disable")
 async def mfa_disable(request: Request, username: str = Depends(get_current_username)):
     """Disable MFA for current user"""
     success, message = MFADatabase.disable_mfa(username)
@@ -1982,13 +2057,10 @@ async def ssl_settings_page(request: Request, current_user: str = Depends(get_cu
 
 @app.get("/api/system/ssl/status", dependencies=[Depends(require_action(Action.MANAGE_SSL))])
 async def get_ssl_status():
-    from roxx.core.security.cert_manager import CertManager
     return CertManager.get_status()
 
 @app.post("/api/system/ssl/upload", dependencies=[Depends(require_action(Action.MANAGE_SSL))])
 async def upload_ssl_cert(request: Request):
-    from roxx.core.security.cert_manager import CertManager
-    
     try:
         # Expecting multipart form or json with content?
         # Let's support JSON with file content strings for simplicity given textarea input, 
@@ -2016,7 +2088,6 @@ async def upload_ssl_cert(request: Request):
 
 @app.post("/api/system/ssl/remove", dependencies=[Depends(require_action(Action.MANAGE_SSL))])
 async def remove_ssl_cert():
-    from roxx.core.security.cert_manager import CertManager
     success, msg = CertManager.remove_cert()
     if success:
         return {"success": True, "message": msg}
@@ -2034,22 +2105,18 @@ async def pki_page(request: Request, username: str = Depends(get_current_usernam
 
 @app.get("/api/pki/status", dependencies=[Depends(require_action(Action.MANAGE_PKI))])
 async def get_pki_status():
-    from roxx.core.security.pki import PKIManager
     status = PKIManager.get_ca_status()
     status["certificates"] = PKIManager.list_certificates()
     return status
 
 @app.post("/api/pki/init", dependencies=[Depends(require_action(Action.MANAGE_PKI))])
 async def init_pki():
-    from roxx.core.security.pki import PKIManager
     if PKIManager.create_ca():
         return {"success": True, "message": "CA Generated"}
     return {"success": False, "message": "CA already exists or failed"}
 
 @app.get("/api/pki/ca/download", dependencies=[Depends(require_action(Action.MANAGE_PKI))])
 async def download_pki_ca():
-    from roxx.core.security.pki import PKIManager
-
     ca_path = PKIManager.get_pki_dir() / "ca.crt"
     if not ca_path.exists():
         raise HTTPException(status_code=404, detail="CA certificate not found")
@@ -2057,15 +2124,11 @@ async def download_pki_ca():
 
 @app.get("/api/pki/certificates", dependencies=[Depends(require_action(Action.MANAGE_PKI))])
 async def list_pki_certificates():
-    from roxx.core.security.pki import PKIManager
-
     return {"certificates": PKIManager.list_certificates()}
 
 @app.get("/api/pki/certificates/{certificate_name}/download",
          dependencies=[Depends(require_action(Action.MANAGE_PKI))])
 async def download_pki_certificate(certificate_name: str):
-    from roxx.core.security.pki import PKIManager
-
     safe_name = Path(certificate_name).name
     cert_path = PKIManager.get_pki_dir() / f"{safe_name}.crt"
     if not cert_path.exists():
@@ -2075,10 +2138,9 @@ async def download_pki_certificate(certificate_name: str):
 # ------------------------------------------------------------------------------
 # TOTP Routes
 # ------------------------------------------------------------------------------
-@app.post("/api/totp/generate-qr", dependencies=[Depends(get_current_username)])
-async def generate_totp_qr(request: Request):
+@app.post("/api/totp/generate-qr")
+async def generate_totp_qr(request: Request, username: str = Depends(get_current_username)):
     """Generate a new TOTP secret and QR code"""
-    username = await get_current_username(request)
     form = await request.form()
     
     # Optional: verify form['username'] matches current user if stricter security needed
@@ -2088,19 +2150,9 @@ async def generate_totp_qr(request: Request):
         # Generate secret
         secret, provisioning_uri = AuthManager.setup_mfa(username)
         
-        # Generate QR Code image
-        import qrcode
-        import io
-        import base64
-        
-        img = qrcode.make(provisioning_uri)
-        buf = io.BytesIO()
-        img.save(buf, format="PNG")
-        img_str = base64.b64encode(buf.getvalue()).decode("utf-8")
-        
         return {
             "success": True,
-            "qr_code": f"data:image/png;base64,{img_str}",
+            "qr_code": MFAManager.generate_qr_code(provisioning_uri),
             "secret": secret
         }
     except Exception as e:
@@ -2173,8 +2225,6 @@ async def get_system_settings():
 @app.put("/api/system/settings", dependencies=[Depends(require_action(Action.MANAGE_SYSTEM_CONFIG))])
 async def update_system_settings(request: Request):
     """Update persisted system settings from JSON."""
-    from roxx.core.auth.config_db import ConfigManager
-
     data = await request.json()
     settings = normalize_system_settings_payload(data)
 
@@ -2194,8 +2244,6 @@ async def config_system_post(
     username: str = Depends(get_current_username)
 ):
     """POST system settings update"""
-    from roxx.core.auth.config_db import ConfigManager
-
     settings = normalize_system_settings_payload({
         "server_name": server_name,
         "radius_auth_port": radius_auth_port,
@@ -2219,7 +2267,6 @@ async def config_nps_migration_page(request: Request, username: str = Depends(ge
 
 @app.post("/api/test/email", dependencies=[Depends(require_action(Action.MANAGE_MFA))])
 async def test_email(request: Request):
-    from roxx.core.auth.email import EmailProvider
     data = await request.json()
     email = data.get("email")
     subject = data.get("subject", "RoXX Test Email")
@@ -2244,12 +2291,8 @@ async def test_email(request: Request):
     result = await EmailProvider.send_email(email, subject, body, config)
     return {"success": result}
 
-@app.post("/api/mfa/cert/register", dependencies=[Depends(get_current_username)])
-async def register_client_cert(request: Request):
-    from roxx.core.security.cert_auth import CertAuthManager
-    from roxx.core.auth.cert_db import CertDatabase
-    
-    username = await get_current_username(request)
+@app.post("/api/mfa/cert/register")
+async def register_client_cert(request: Request, username: str = Depends(get_current_username)):
     cert_info = CertAuthManager.get_cert_info(request)
     if not cert_info:
         raise HTTPException(status_code=400, detail="No client certificate presented")
@@ -2259,23 +2302,18 @@ async def register_client_cert(request: Request):
     CertDatabase.add_cert(username, cert_info['fingerprint'], cert_info['common_name'], cert_info['issuer'], f"Registered: {datetime.now().strftime('%Y-%m-%d')}")
     return {"success": True, "message": "Certificate linked successfully"}
 
-@app.get("/api/mfa/cert/list", dependencies=[Depends(get_current_username)])
-async def list_client_certs(request: Request):
-    from roxx.core.auth.cert_db import CertDatabase
-    username = await get_current_username(request)
+@app.get("/api/mfa/cert/list")
+async def list_client_certs(username: str = Depends(get_current_username)):
     return CertDatabase.get_user_certs(username)
 
-@app.delete("/api/mfa/cert/{cert_id}", dependencies=[Depends(get_current_username)])
-async def delete_client_cert(cert_id: int, request: Request):
-    from roxx.core.auth.cert_db import CertDatabase
-    username = await get_current_username(request)
+@app.delete("/api/mfa/cert/{cert_id}")
+async def delete_client_cert(cert_id: int, username: str = Depends(get_current_username)):
     if CertDatabase.delete_cert(username, cert_id):
         return {"success": True}
     raise HTTPException(status_code=404, detail="Certificate not found")
 
 @app.post("/api/system/ssl/ca", dependencies=[Depends(require_action(Action.MANAGE_SSL))])
 async def upload_ca_bundle(file: UploadFile = File(...)):
-    from roxx.core.security.cert_manager import CertManager
     content = (await file.read()).decode('utf-8')
     success, msg = CertManager.upload_ca(content)
     if success:
@@ -2284,7 +2322,6 @@ async def upload_ca_bundle(file: UploadFile = File(...)):
 
 @app.delete("/api/system/ssl/ca", dependencies=[Depends(require_action(Action.MANAGE_SSL))])
 async def remove_ca_bundle():
-    from roxx.core.security.cert_manager import CertManager
     success, msg = CertManager.remove_ca()
     if success:
         return {"success": True, "message": msg}
@@ -2296,11 +2333,6 @@ async def remove_ca_bundle():
 # ------------------------------------------------------------------------------
 # SAML Authentication Routes
 # ------------------------------------------------------------------------------
-# NOTE: SAML imports are lazy-loaded due to xmlsec dependency issues
-# from roxx.core.auth.saml_provider import SAMLProvider
-from roxx.core.auth.config_db import ConfigManager
-from fastapi.responses import Response
-
 @app.get("/auth/saml/metadata/{provider_id}")
 async def saml_metadata(provider_id: int):
     """
@@ -2309,11 +2341,6 @@ async def saml_metadata(provider_id: int):
     Args:
         provider_id: ID of the SAML provider configuration
     """
-    try:
-        from roxx.core.auth.saml_provider import SAMLProvider
-    except ImportError as e:
-        raise HTTPException(status_code=503, detail=f"SAML not available: {e}")
-    
     provider = ConfigManager.get_provider(provider_id)
     if not provider or provider['provider_type'] != 'saml':
         raise HTTPException(status_code=404, detail="SAML provider not found")
@@ -2415,7 +2442,6 @@ async def saml_acs(provider_id: int, request: Request):
             raise HTTPException(status_code=401, detail=error)
         
         # Create or update user from SAML attributes
-        from roxx.core.auth.manager import AuthManager
         username = user_data['username']
         
         # Check if user exists, create if needed
@@ -2424,7 +2450,7 @@ async def saml_acs(provider_id: int, request: Request):
             if not auth_success:
                 # Create user with external auth source
                 AuthManager.create_admin(username, None, auth_source='saml')
-        except:
+        except Exception:
             AuthManager.create_admin(username, None, auth_source='saml')
         
         # Set session
@@ -2458,7 +2484,6 @@ async def saml_acs(provider_id: int, request: Request):
 async def test_duo(request: Request):
     """Test Duo API connectivity"""
     data = await request.json()
-    from roxx.core.auth.duo import DuoProvider
     duo = DuoProvider(data)
     success, msg = duo.check()
     return {"success": success, "message": msg}
@@ -2472,13 +2497,11 @@ async def duo_auth(request: Request):
     passcode = data.get('passcode')
     
     # Load Duo config from provider
-    from roxx.core.auth.config_db import ConfigManager
     providers = ConfigManager.list_providers(provider_type='duo')
     if not providers:
         raise HTTPException(status_code=404, detail="No Duo provider configured")
     
     config = providers[0]['config']
-    from roxx.core.auth.duo import DuoProvider
     duo = DuoProvider(config)
     success, result = duo.auth(username, factor=factor, passcode=passcode)
     return {"success": success, **result}
@@ -2491,13 +2514,11 @@ async def duo_auth_status(request: Request):
     if not txid:
         raise HTTPException(status_code=400, detail="txid required")
     
-    from roxx.core.auth.config_db import ConfigManager
     providers = ConfigManager.list_providers(provider_type='duo')
     if not providers:
         raise HTTPException(status_code=404, detail="No Duo provider configured")
     
     config = providers[0]['config']
-    from roxx.core.auth.duo import DuoProvider
     duo = DuoProvider(config)
     success, result = duo.auth_status(txid)
     return {"success": success, **result}
@@ -2510,7 +2531,6 @@ async def duo_auth_status(request: Request):
 async def test_okta(request: Request):
     """Test Okta API connectivity"""
     data = await request.json()
-    from roxx.core.auth.okta import OktaProvider
     okta = OktaProvider(data)
     success, msg = okta.test_connection()
     return {"success": success, "message": msg}
@@ -2523,13 +2543,11 @@ async def okta_verify(request: Request):
     factor_id = data.get('factor_id')
     passcode = data.get('passcode')
     
-    from roxx.core.auth.config_db import ConfigManager
     providers = ConfigManager.list_providers(provider_type='okta')
     if not providers:
         raise HTTPException(status_code=404, detail="No Okta provider configured")
     
     config = providers[0]['config']
-    from roxx.core.auth.okta import OktaProvider
     okta = OktaProvider(config)
     success, result = okta.verify_factor(username, factor_id, passcode)
     return {"success": success, **result}
@@ -2537,13 +2555,11 @@ async def okta_verify(request: Request):
 @app.get("/api/mfa/okta/factors/{username}", dependencies=[Depends(require_action(Action.MANAGE_MFA))])
 async def okta_list_factors(username: str, request: Request):
     """List Okta MFA factors for a user"""
-    from roxx.core.auth.config_db import ConfigManager
     providers = ConfigManager.list_providers(provider_type='okta')
     if not providers:
         raise HTTPException(status_code=404, detail="No Okta provider configured")
     
     config = providers[0]['config']
-    from roxx.core.auth.okta import OktaProvider
     okta = OktaProvider(config)
     success, factors = okta.list_factors(username)
     if success:
@@ -2557,8 +2573,7 @@ async def okta_list_factors(username: str, request: Request):
 async def radius_backend_stats():
     """Get RADIUS backend manager statistics including cache"""
     try:
-        from roxx.core.radius_backends.manager import get_manager
-        mgr = get_manager()
+        mgr = radius_backend_manager.get_manager()
         return mgr.get_stats()
     except Exception as e:
         logger.error(f"Error getting RADIUS stats: {e}")
@@ -2567,7 +2582,6 @@ async def radius_backend_stats():
 
 def silence_windows_proactor_reset():
     """Silences noisy ConnectionResetError on Windows asyncio/proactor"""
-    import platform
     if platform.system() == 'Windows':
         from asyncio import proactor_events
         
@@ -2597,7 +2611,6 @@ async def webauthn_login_options(request: Request):
         raise HTTPException(status_code=401, detail="Invalid session")
     username = auth["username"]
 
-    from roxx.core.auth.webauthn import WebAuthnManager
     options, state = WebAuthnManager.generate_authentication_options(username)
     
     if not options:
@@ -2606,14 +2619,14 @@ async def webauthn_login_options(request: Request):
     # Store state in session
     request.session["webauthn_state"] = state
     
-    return JSONResponse(options)
+    return ORJSONResponse(options)
 
 @app.post("/api/webauthn/login/verify")
 async def webauthn_login_verify(request: Request):
     """Verify WebAuthn login"""
     try:
         data = await request.json()
-    except:
+    except ValueError:
         raise HTTPException(status_code=400, detail="Invalid JSON")
         
     auth = get_auth_context(request)
@@ -2625,19 +2638,18 @@ async def webauthn_login_verify(request: Request):
     if not state:
         raise HTTPException(status_code=400, detail="State not found")
         
-    from roxx.core.auth.webauthn import WebAuthnManager
     success, msg = WebAuthnManager.verify_authentication(username, data, state)
     
     if success:
         # Success!
         set_auth_context(request, username, "active")
-        response = JSONResponse({"success": True})
+        response = ORJSONResponse({"success": True})
         response.delete_cookie("session")
         request.session.pop("webauthn_state", None)
         request.session.pop('mfa_username', None)
         return response
     else:
-        return JSONResponse({"success": False, "detail": msg}, status_code=400)
+        return ORJSONResponse({"success": False, "detail": msg}, status_code=400)
 
 
 if __name__ == "__main__":
@@ -6,10 +6,11 @@ import hmac
 import os
 
 from fastapi import APIRouter, Header, HTTPException
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import PlainTextResponse
 
 from roxx.core.observability import request_metrics
 from roxx.core.readiness import collect_readiness_checks
+from roxx.web.responses import ORJSONResponse
 
 
 router = APIRouter(tags=["operations"])
@@ -21,7 +22,7 @@ async def liveness_check() -> dict[str, str]:
 
 
 @router.get("/readyz")
-async def readiness_check() -> JSONResponse:
+async def readiness_check() -> ORJSONResponse:
     checks = collect_readiness_checks()
     ready = all(checks.values())
     payload = {
@@ -29,7 +30,7 @@ async def readiness_check() -> JSONResponse:
         "service": "roxx-web",
         "checks": checks,
     }
-    return JSONResponse(payload, status_code=200 if ready else 503)
+    return ORJSONResponse(payload, status_code=200 if ready else 503)
 
 
 @router.get("/metrics", response_class=PlainTextResponse)
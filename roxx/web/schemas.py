@@ -0,0 +1,57 @@
+"""Request body models for the RoXX JSON API."""
+
+from __future__ import annotations
+
+from typing import Annotated, Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+# Required identifiers must be non-empty, like the old `if not value` checks
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+
+
+class AuthProviderCreate(BaseModel):
+    provider_type: NonEmptyStr
+    name: NonEmptyStr
+    config: Dict[str, Any] = Field(default_factory=dict)
+    enabled: bool = True
+
+
+class AuthProviderUpdate(BaseModel):
+    name: Optional[str] = None
+    config: Optional[Dict[str, Any]] = None
+    enabled: Optional[bool] = None
+
+
+class AuthProviderTest(BaseModel):
+    provider_type: NonEmptyStr
+    config: Dict[str, Any] = Field(default_factory=dict)
+    test_username: NonEmptyStr
+    test_password: NonEmptyStr
+
+
+class RadiusBackendCreate(BaseModel):
+    backend_type: NonEmptyStr
+    name: NonEmptyStr
+    config: Dict[str, Any] = Field(default_factory=dict)
+    enabled: bool = True
+    priority: int = 100
+
+
+class RadiusBackendUpdate(BaseModel):
+    name: Optional[str] = None
+    config: Optional[Dict[str, Any]] = None
+    enabled: Optional[bool] = None
+    priority: Optional[int] = None
+
+
+class RadiusBackendTest(BaseModel):
+    backend_type: Optional[str] = None
+    config: Dict[str, Any] = Field(default_factory=dict)
+    test_username: Optional[str] = None
+    test_password: Optional[str] = None
+
+
+class RadiusAuthRequest(BaseModel):
+    username: NonEmptyStr
+    password: NonEmptyStr
@@ -41,6 +41,10 @@ def build_binary(entry_script: str, name: str) -> None:
         "uvicorn.logging",
         "--hidden-import",
         "uvicorn.loops.auto",
+        "--hidden-import",
+        "uvicorn.loops.uvloop",
+        "--hidden-import",
+        "uvicorn.protocols.http.httptools_impl",
         "--exclude-module",
         "roxx.web.mfa_routes",
     ]
@@ -0,0 +1,52 @@
+"""Compile roxx/config/locales.json into an importable Python module."""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCE = ROOT / "roxx" / "config" / "locales.json"
+TARGET = ROOT / "roxx" / "utils" / "_locales_compiled.py"
+
+HEADER = '''"""
+Compiled translation catalog.
+
+Generated by scripts/compile_locales.py from roxx/config/locales.json; do not edit.
+"""
+
+'''
+
+
+def render_module(catalog: dict) -> str:
+    lines = ["TRANSLATIONS = {"]
+    for key, per_locale in catalog.items():
+        if not isinstance(per_locale, dict):
+            lines.append(f"    {key!r}: {per_locale!r},")
+            continue
+        lines.append(f"    {key!r}: {{")
+        for locale, text in per_locale.items():
+            lines.append(f"        {locale!r}: {text!r},")
+        lines.append("    },")
+    lines.append("}")
+    return HEADER + "\n".join(lines) + "\n"
+
+
+def compile_locales(source: Path = SOURCE, target: Path = TARGET) -> Path:
+    catalog = json.loads(source.read_text(encoding="utf-8"))
+    target.write_text(render_module(catalog), encoding="utf-8")
+    return target
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--source", type=Path, default=SOURCE)
+    parser.add_argument("--output", type=Path, default=TARGET)
+    args = parser.parse_args()
+    print(compile_locales(args.source, args.output))
+
+
+if __name__ == "__main__":
+    main()
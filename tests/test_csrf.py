@@ -0,0 +1,38 @@
+import logging
+
+from roxx.core.security import csrf
+
+
+def test_csrf_key_is_published_once_and_shared(monkeypatch, tmp_path):
+    key_path = tmp_path / "roxx_csrf_key"
+    monkeypatch.delenv("ROXX_CSRF_KEY", raising=False)
+    monkeypatch.setattr(csrf, "CSRF_KEY_PATH", key_path)
+
+    first = csrf._load_csrf_secret_key()
+    assert key_path.read_text() == first
+    assert key_path.stat().st_mode & 0o777 == 0o600
+    # Later workers pick up the published key and leave no temp files behind
+    assert csrf._load_csrf_secret_key() == first
+    assert list(tmp_path.iterdir()) == [key_path]
+
+
+def test_csrf_key_race_loser_uses_winner_key(tmp_path):
+    key_path = tmp_path / "roxx_csrf_key"
+    key_path.write_text("ab" * 32)
+    key_path.chmod(0o600)
+
+    assert csrf._publish_shared_key(key_path, "cd" * 32) == "ab" * 32
+    assert list(tmp_path.iterdir()) == [key_path]
+
+
+def test_csrf_key_falls_back_with_warning(monkeypatch, tmp_path, caplog):
+    key_path = tmp_path / "roxx_csrf_key"
+    key_path.write_text("not hex")
+    key_path.chmod(0o600)
+    monkeypatch.delenv("ROXX_CSRF_KEY", raising=False)
+    monkeypatch.setattr(csrf, "CSRF_KEY_PATH", key_path)
+
+    with caplog.at_level(logging.WARNING, logger="roxx.security.csrf"):
+        key = csrf._load_csrf_secret_key()
+    assert len(key) == 64
+    assert "per-process CSRF key" in caplog.text
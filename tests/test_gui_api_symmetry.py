@@ -1,5 +1,6 @@
 from fastapi.testclient import TestClient
 import asyncio
+import base64
 import json
 import roxx.web.app as web_app
 
@@ -193,6 +194,8 @@ def test_sensitive_pages_require_auth():
     assert pki_page.status_code == 401
     assert health.status_code == 401
     assert mfa_status.status_code == 401
+    # Cookie-auth routes must not invite a browser Basic Auth prompt
+    assert "www-authenticate" not in mfa_status.headers
 
 
 def test_liveness_probe_is_public_and_minimal():
@@ -351,3 +354,209 @@ def test_nps_import_respects_selected_entries(monkeypatch):
     assert len(created_backends) == 1
     assert created_backends[0][1].startswith("NPS_Branch_192_168_1_11")
     assert created_backends[0][2]["secret"] == "branch-secret"
+
+
+def test_users_page_usernames_follow_users_conf_edits(monkeypatch, tmp_path):
+    allow_role(monkeypatch, "superadmin")
+    monkeypatch.setattr(web_app.SystemManager, "get_config_dir", lambda: tmp_path)
+    users_file = tmp_path / "users.conf"
+
+    def usernames():
+        return tuple(entry["username"] for entry in web_app._read_user_entries(users_file))
+
+    assert usernames() == ()
+
+    users_file.write_text('# comment\nalice Cleartext-Password := "a"\n')
+    assert usernames() == ("alice",)
+    assert TestClient(web_app.app).get("/users").status_code == 200
+
+    users_file.write_text('# comment\nalice Cleartext-Password := "a"\nbob Cleartext-Password := "b"\n')
+    assert usernames() == ("alice", "bob")
+
+    # Lines without all four fields are not user entries
+    users_file.write_bytes(b'  # indented comment\r\n\r\n\tcarol Cleartext-Password := "c"\r\n   \ndave')
+    assert usernames() == ("carol",)
+
+    users_file.write_text("")
+    assert usernames() == ()
+
+
+def test_users_api_follows_users_conf_edits(monkeypatch, tmp_path):
+    allow_role(monkeypatch, "superadmin")
+    monkeypatch.setattr(web_app.SystemManager, "get_config_dir", lambda: tmp_path)
+    client = TestClient(web_app.app)
+    users_file = tmp_path / "users.conf"
+    assert client.get("/api/users").json() == []
+
+    users_file.write_bytes(
+        b'# alice Cleartext-Password := "x"\r\n\tbob Cleartext-Password := "b"\r\n'
+        b'carol Cleartext-Password :=\n'
+        b'dave   Crypt-Password  ==  "d"'
+    )
+    assert client.get("/api/users").json() == [
+        {"username": "bob", "attribute": "Cleartext-Password", "op": ":=", "password": "b"},
+        {"username": "dave", "attribute": "Crypt-Password", "op": "==", "password": "d"},
+    ]
+
+    users_file.write_text('erin Cleartext-Password := "e"\n')
+    assert [u["username"] for u in client.get("/api/users").json()] == ["erin"]
+
+
+def test_html_pages_are_gzip_compressed(monkeypatch):
+    allow_role(monkeypatch, "superadmin")
+    client = TestClient(web_app.app)
+
+    response = client.get("/system/observability", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Observability & Health" in response.text
+
+
+def test_login_page_is_served_from_prerendered_html():
+    client = TestClient(web_app.app)
+
+    first = client.get("/login")
+    second = client.get("/login")
+
+    assert first.status_code == 200
+    assert first.text == second.text
+    assert first.text == web_app.templates.get_template("login.html").render()
+
+
+def test_static_assets_are_versioned_and_cached():
+    client = TestClient(web_app.app)
+
+    url = web_app.static_url("css/main.css")
+    assert url.startswith("/static/css/main.css?v=")
+    assert url in client.get("/login").text
+
+    versioned = client.get(url)
+    assert versioned.status_code == 200
+    assert versioned.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert "immutable" not in client.get("/static/css/main.css").headers.get("cache-control", "")
+
+
+def test_websocket_basic_auth_fallback(monkeypatch):
+    import base64
+    import hashlib
+    from types import SimpleNamespace
+
+    monkeypatch.setattr(web_app, "get_auth_context", lambda request: None)
+    monkeypatch.setattr(web_app, "_BASIC_AUTH_USER_DIGEST", hashlib.sha256(b"admin").digest())
+    monkeypatch.setattr(web_app, "_BASIC_AUTH_PASS_DIGEST", hashlib.sha256(b"admin").digest())
+
+    def ws_user(header):
+        headers = {"authorization": header} if header is not None else {}
+        return asyncio.run(web_app.get_current_username_ws(SimpleNamespace(headers=headers)))
+
+    token = base64.b64encode(b"admin:admin").decode()
+    assert ws_user(f"Basic {token}") == "admin"
+    assert ws_user(f"basic {token}") == "admin"
+    assert ws_user(f"Bearer {token}") is None
+    assert ws_user("Basic " + base64.b64encode(b"admin:wrong").decode()) is None
+    assert ws_user("Basic") is None
+    assert ws_user(None) is None
+
+
+def test_mfa_setup_page_reuses_pending_secret(monkeypatch):
+    allow_role(monkeypatch, "admin")
+    client = TestClient(web_app.app)
+
+    first = client.get("/auth/mfa-setup", headers={"Accept": "text/html"})
+    second = client.get("/auth/mfa-setup", headers={"Accept": "text/html"})
+    assert first.status_code == 200
+    assert first.text == second.text
+    assert 'src="/auth/mfa-setup/qr.svg"' in first.text
+    assert "base64," not in first.text
+
+    qr = client.get("/auth/mfa-setup/qr.svg")
+    assert qr.status_code == 200
+    assert qr.headers["content-type"].startswith("image/svg+xml")
+    assert qr.headers["cache-control"] == "no-store"
+    assert qr.text.startswith("<svg")
+
+    # Only a nonce rides in the signed (not encrypted) session cookie
+    payload = base64.b64decode(client.cookies["roxx_session"].split(".")[0] + "==")
+    secret = web_app._mfa_setup_pending[json.loads(payload)["mfa_setup_nonce"]][2]
+    assert secret in first.text
+    assert secret.encode() not in payload
+
+
+def test_log_websocket_streams_roxx_log_records(monkeypatch):
+    import logging
+
+    allow_role(monkeypatch, "admin")
+    # The lifespan attaches the broadcaster to the roxx logger
+    with TestClient(web_app.app) as client, client.websocket_connect("/ws/logs") as ws:
+        assert ws.receive_text() == "Connected to Real-Time System Logs..."
+        logger = logging.getLogger("roxx.web")
+        previous = logger.level
+        logger.setLevel(logging.INFO)
+        try:
+            logger.info("streamed to websocket")
+        finally:
+            logger.setLevel(previous)
+        # Earlier roxx.* records may be replayed first as history
+        frame = ws.receive_text()
+        while not frame.endswith("roxx.web: streamed to websocket"):
+            frame = ws.receive_text()
+    assert web_app.log_broadcaster not in logging.getLogger("roxx").handlers
+
+
+def test_auth_provider_create_validates_body(monkeypatch):
+    allow_role(monkeypatch, "superadmin")
+
+    captured = {}
+    monkeypatch.setattr(
+        "roxx.core.auth.config_db.ConfigManager.create_provider",
+        lambda *args: captured.setdefault("args", args) and (True, "created", 7),
+    )
+
+    client = TestClient(web_app.app)
+    assert client.post("/api/auth-providers", json={"provider_type": "ldap"}).status_code == 422
+    assert client.post("/api/auth-providers", json={"provider_type": "ldap", "name": ""}).status_code == 422
+    assert "args" not in captured
+
+    response = client.post("/api/auth-providers", json={"provider_type": "ldap", "name": "Corp"})
+    assert response.status_code == 200
+    assert response.json()["id"] == 7
+    assert captured["args"] == ("ldap", "Corp", {}, True)
+
+
+def test_static_assets_skip_the_session_cookie(monkeypatch):
+    import itsdangerous
+
+    allow_role(monkeypatch, "admin")
+    client = TestClient(web_app.app)
+    client.get("/auth/mfa-setup", headers={"Accept": "text/html"})
+    assert "roxx_session" in client.cookies
+
+    unsigned = []
+    original = itsdangerous.TimestampSigner.unsign
+    monkeypatch.setattr(
+        itsdangerous.TimestampSigner, "unsign",
+        lambda self, *a, **kw: unsigned.append(1) or original(self, *a, **kw),
+    )
+    assert client.get("/static/css/main.css").status_code == 200
+    assert client.get("/livez").status_code == 200
+    assert unsigned == []
+
+    client.get("/auth/mfa-setup", headers={"Accept": "text/html"})
+    assert unsigned == [1]
+
+
+def test_login_runs_password_check_on_kdf_executor(monkeypatch):
+    import threading
+
+    threads = []
+
+    def fake_verify(username, password):
+        threads.append(threading.current_thread().name)
+        return False, None
+
+    monkeypatch.setattr(web_app.AuthManager, "verify_credentials", fake_verify)
+    client = TestClient(web_app.app)
+    response = client.post("/login", data={"username": "admin", "password": "wrong"})
+    assert response.status_code == 401
+    assert threads and threads[0].startswith("kdf")
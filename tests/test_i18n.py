@@ -2,8 +2,11 @@
 Unit tests for I18n system
 """
 
+import json
+from pathlib import Path
 
 from roxx.utils.i18n import I18n, translate, set_locale, get_locale
+from roxx.utils._locales_compiled import TRANSLATIONS
 
 
 class TestI18n:
@@ -37,6 +40,19 @@ class TestI18n:
         i18n.set_locale("FR")
         assert i18n.locale == "FR"
     
+    def test_set_locale_switches_translations(self):
+        """Test that translations follow the active locale"""
+        i18n = I18n(locale="EN")
+        i18n.translations = {"stop": {"EN": "Stop", "FR": "Arreter"}, "only_en": {"EN": "Only"}}
+        i18n.set_locale("FR")
+        
+        assert i18n.translate("stop") == "Arreter"
+        assert i18n.translate("only_en", "Default") == "only_en"
+        assert i18n.translate("unknown", "Default") == "Default"
+        
+        i18n.set_locale("en")
+        assert i18n.translate("stop") == "Stop"
+    
     def test_global_translate(self):
         """Test global translate function"""
         result = translate("app_title", "Default")
@@ -59,3 +75,47 @@ class TestI18n:
         assert i18n.translate("services") is not None
         assert i18n.translate("status") is not None
         assert i18n.translate("exit") is not None
+    
+    def test_catalog_shared_between_instances(self, tmp_path, monkeypatch):
+        """Test that a catalog file is parsed once and shared"""
+        catalog = tmp_path / "locales.json"
+        catalog.write_text('{"greeting": {"EN": "Hello", "FR": "Bonjour"}}', encoding="utf-8")
+        monkeypatch.setattr("roxx.utils.i18n.SystemManager.get_config_dir", lambda: tmp_path)
+        monkeypatch.setattr("roxx.utils.i18n.__file__", str(tmp_path / "pkg" / "utils" / "i18n.py"))
+        monkeypatch.setattr("roxx.utils.i18n._load_compiled_translations", lambda: None)
+        I18n.invalidate_cache()
+        
+        first = I18n(locale="FR")
+        assert first.translations is None  # Nothing is read until first use
+        assert first.translate("greeting") == "Bonjour"
+        
+        catalog.write_text('{"greeting": {"EN": "Changed", "FR": "Change"}}', encoding="utf-8")
+        second = I18n(locale="FR")
+        
+        assert second.translate("greeting") == "Bonjour"
+        assert second.translations is first.translations
+        
+        I18n.invalidate_cache()
+        assert I18n(locale="FR").translate("greeting") == "Change"
+    
+    def test_duplicate_strings_are_shared(self, tmp_path, monkeypatch):
+        """Test that identical translations across keys/locales are one object"""
+        catalog = tmp_path / "locales.json"
+        catalog.write_text('{"a": {"EN": "Services", "FR": "Services"}}', encoding="utf-8")
+        monkeypatch.setattr("roxx.utils.i18n.SystemManager.get_config_dir", lambda: tmp_path)
+        monkeypatch.setattr("roxx.utils.i18n.__file__", str(tmp_path / "pkg" / "utils" / "i18n.py"))
+        monkeypatch.setattr("roxx.utils.i18n._load_compiled_translations", lambda: None)
+        I18n.invalidate_cache()
+        
+        i18n = I18n()
+        i18n.load_translations()
+        
+        assert i18n.translations["a"]["EN"] is i18n.translations["a"]["FR"]
+        I18n.invalidate_cache()
+    
+    def test_compiled_catalog_matches_json(self):
+        """Test that the compiled catalog is regenerated after editing locales.json"""
+        source = Path(__file__).parent.parent / "roxx" / "config" / "locales.json"
+        assert TRANSLATIONS == json.loads(source.read_text(encoding="utf-8")), (
+            "Run scripts/compile_locales.py"
+        )
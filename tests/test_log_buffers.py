@@ -2,7 +2,12 @@
 Unit tests for authentication log buffers
 """
 
+import asyncio
+import logging
+import sys
+
 from roxx.core.logging.auth_log_buffer import AuthLogBuffer
+from roxx.core.logging.broadcast import LogBroadcaster
 
 
 class TestAuthLogBuffer:
@@ -133,3 +138,97 @@ class TestAuthLogBuffer:
         
         logs = buffer.get_logs()
         assert len(logs) == 50
+
+
+
+class TestLogBroadcaster:
+    """Test log fan-out to WebSocket subscribers"""
+    
+    def test_fan_out_and_drop_when_full(self):
+        """Each subscriber gets every line once; full queues drop the oldest"""
+        broadcaster = LogBroadcaster(queue_size=2)
+        broadcaster.setFormatter(logging.Formatter("%(message)s"))
+        log = logging.getLogger("roxx.test.broadcast")
+        log.setLevel(logging.INFO)
+        log.addHandler(broadcaster)
+        
+        async def scenario():
+            first = broadcaster.subscribe()
+            second = broadcaster.subscribe()
+            for i in range(3):
+                log.info("line %d", i)
+            await asyncio.sleep(0)
+            broadcaster.unsubscribe(second)
+            log.info("after")
+            await asyncio.sleep(0)
+            return [first.get_nowait() for _ in range(first.qsize())], second.qsize()
+        
+        try:
+            first_lines, second_size = asyncio.run(scenario())
+        finally:
+            log.removeHandler(broadcaster)
+        
+        assert first_lines == ["line 2", "after"]
+        assert second_size == 2
+        assert broadcaster.subscriber_count == 1
+    
+    def test_one_wakeup_per_loop(self, monkeypatch):
+        """Subscribers on the same loop share one call_soon_threadsafe per line"""
+        broadcaster = LogBroadcaster()
+        record = logging.LogRecord("roxx.test", logging.INFO, __file__, 1, "hello", None, None)
+        
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            queues = [broadcaster.subscribe() for _ in range(5)]
+            calls = []
+            original = loop.call_soon_threadsafe
+            monkeypatch.setattr(loop, "call_soon_threadsafe", lambda *a: calls.append(a) or original(*a))
+            broadcaster.emit(record)
+            await asyncio.sleep(0)
+            return len(calls), [q.qsize() for q in queues]
+        
+        wakeups, sizes = asyncio.run(scenario())
+        assert wakeups == 1
+        assert sizes == [1] * 5
+
+    def test_next_batch_coalesces_queued_lines(self):
+        """Queued lines are joined into one message, capped by size"""
+        async def scenario():
+            queue = asyncio.Queue()
+            for i in range(4):
+                queue.put_nowait("line %d" % i)
+            first = await LogBroadcaster.next_batch(queue, max_bytes=12)
+            rest = await LogBroadcaster.next_batch(queue)
+            return first, rest
+        
+        first, rest = asyncio.run(scenario())
+        assert first == "line 0\nline 1"
+        assert rest == "line 2\nline 3"
+
+    def test_new_subscriber_gets_recent_history(self):
+        """subscribe() replays the last lines as formatted at log time"""
+        broadcaster = LogBroadcaster(queue_size=4, history=3)
+        broadcaster.setFormatter(logging.Formatter("%(message)s"))
+        for i in range(3):
+            broadcaster.handle(logging.LogRecord("roxx.test", logging.INFO, __file__, 1, "old %d", (i,), None))
+        # Args mutated after the log call must not change the stored line
+        args = {"n": 3}
+        broadcaster.handle(logging.LogRecord("roxx.test", logging.INFO, __file__, 1, "old %(n)d", (args,), None))
+        args["n"] = 99
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        failed = logging.LogRecord("roxx.test", logging.ERROR, __file__, 1, "failed", None, exc_info)
+        broadcaster.handle(failed)
+        # Only text is kept: the traceback's frames are not referenced
+        assert all(isinstance(line, str) for line in broadcaster._history)
+        
+        async def scenario():
+            queue = broadcaster.subscribe()
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+        
+        lines = asyncio.run(scenario())
+        assert lines[:2] == ["old 2", "old 3"]
+        assert lines[2].startswith("failed\nTraceback")
+        assert lines[2].endswith("ValueError: boom")
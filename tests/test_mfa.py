@@ -39,10 +39,26 @@ class TestMFAManager:
         
         qr_data = MFAManager.generate_qr_code(uri)
         
-        # Should be data URL with base64 encoded PNG
-        assert qr_data.startswith("data:image/png;base64,")
+        # Should be data URL with base64 encoded SVG
+        assert qr_data.startswith("data:image/svg+xml;base64,")
         assert len(qr_data) > 100  # Reasonable size for QR code
     
+    def test_render_qr_svg_covers_dark_modules(self):
+        """Test the SVG path draws exactly the QR matrix's dark modules"""
+        import re
+        import qrcode
+        uri = "otpauth://totp/RoXX:test@example.com?secret=JBSWY3DPEHPK3PXP&issuer=RoXX"
+        
+        svg = MFAManager.render_qr_svg(uri, box_size=5)
+        
+        qr = qrcode.QRCode(error_correction=qrcode.constants.ERROR_CORRECT_L, border=4)
+        qr.add_data(uri)
+        qr.make(fit=True)
+        matrix = qr.get_matrix()
+        drawn = sum(int(n) for n in re.findall(r"h(\d+)v", svg))
+        assert drawn == sum(sum(row) for row in matrix)
+        assert f'width="{len(matrix) * 5}"' in svg
+    
     def test_verify_totp_valid(self):
         """Test TOTP verification with valid token"""
         secret = "JBSWY3DPEHPK3PXP"
@@ -160,5 +176,23 @@ class TestMFAManager:
         assert token1 != token2
 
 
+class TestAuthManagerTOTPSetup:
+    """Test the provisioning URI built by AuthManager.setup_mfa"""
+    
+    def test_setup_mfa_escapes_username(self):
+        """Test special characters in the username survive a URI round trip"""
+        from roxx.core.auth.manager import AuthManager
+        
+        from urllib.parse import parse_qs, unquote, urlsplit
+        
+        secret, uri = AuthManager.setup_mfa("bob smith@example.com?x=1&y")
+        parts = urlsplit(uri)
+        
+        assert parts.scheme == "otpauth"
+        assert unquote(parts.path) == "/RoXX:bob smith@example.com?x=1&y"
+        assert parse_qs(parts.query) == {"secret": [secret], "issuer": ["RoXX"]}
+
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
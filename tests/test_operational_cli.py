@@ -52,3 +52,14 @@ def test_non_interactive_bootstrap_writes_production_environment(monkeypatch, tm
     assert "ROXX_SECRET_KEY=" in environment
     assert "ROXX_SECRET_KEY" not in summary
     assert result.certificate_generated is True
+
+
+def test_console_log_viewer_reads_only_the_tail(tmp_path):
+    from roxx.cli.console import _tail_lines
+
+    log = tmp_path / "radius.log"
+    log.write_text("".join(f"line {i}\n" for i in range(1000)))
+
+    assert _tail_lines(log, 3, block_size=16) == ["line 997\n", "line 998\n", "line 999\n"]
+    assert _tail_lines(log, 50) == [f"line {i}\n" for i in range(950, 1000)]
+    assert _tail_lines(tmp_path / "radius.log", 2000)[0] == "line 0\n"
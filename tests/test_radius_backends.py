@@ -2,9 +2,10 @@
 Unit tests for RADIUS backends functionality
 """
 
-from roxx.core.radius_backends.cache import AuthCache
+from roxx.core.radius_backends.cache import AuthCache, FailureCache
 from roxx.core.radius_backends.config_db import RadiusBackendDB
 from roxx.core.radius_backends.duo_backend import DuoRadiusBackend
+from roxx.core.radius_backends.manager import RadiusBackendManager
 from roxx.core.radius_backends.okta_backend import OktaRadiusBackend
 
 
@@ -82,6 +83,33 @@ class TestAuthCache:
         assert cache.get('user1', 'pass1') is None
 
 
+class TestFailureCache:
+    """Test negative authentication cache"""
+    
+    def test_failure_is_remembered(self):
+        """Test that only the exact rejected pair is cached"""
+        cache = FailureCache(ttl=60)
+        
+        cache.add('testuser', 'wrong')
+        
+        assert cache.contains('testuser', 'wrong') is True
+        assert cache.contains('testuser', 'correct') is False
+        assert cache.contains('otheruser', 'wrong') is False
+        assert cache.get_stats()['hits'] == 1
+    
+    def test_failure_expires(self, monkeypatch):
+        """Test that entries expire after TTL"""
+        cache = FailureCache(ttl=2, max_size=1)
+        now = [1000.0]
+        monkeypatch.setattr('roxx.core.radius_backends.cache.time.monotonic', lambda: now[0])
+        
+        cache.add('testuser', 'wrong')
+        now[0] += 3
+        
+        assert cache.contains('testuser', 'wrong') is False
+        assert cache.get_stats()['size'] == 0
+
+
 class TestRadiusBackendDB:
     """Test RADIUS backend database operations"""
     
@@ -268,3 +296,15 @@ class TestMfaRadiusBackends:
         assert success is True
         assert attrs["Reply-Message"] == "Authenticated via Okta"
         assert backend.test_connection() == (True, "Connected")
+
+
+class TestRadiusBackendManagerTest:
+    """Test the stateless backend configuration check"""
+
+    def test_test_backend_needs_no_manager_instance(self, monkeypatch):
+        """test_backend is callable on the class and never loads configured backends"""
+        def fail_load(self):
+            raise AssertionError("configured backends must not be loaded")
+        monkeypatch.setattr(RadiusBackendManager, "_load_backends", fail_load)
+
+        assert RadiusBackendManager.test_backend("bogus", {}, None, None) == (False, "Unknown backend type: bogus")
@@ -3,7 +3,7 @@ import base64
 
 from starlette.requests import Request
 
-from roxx.core.auth.rbac import Action, get_auth_context, require_action, require_role
+from roxx.core.auth.rbac import Action, get_auth_context, require_action, require_role, set_auth_context
 
 
 def make_request(*, cookie_value=None, session_auth=None):
@@ -23,16 +23,36 @@ def make_request(*, cookie_value=None, session_auth=None):
     return Request(scope)
 
 
-def test_get_auth_context_migrates_legacy_cookie_and_resolves_role_server_side(monkeypatch):
+def test_get_auth_context_ignores_unsigned_legacy_cookie(monkeypatch):
     monkeypatch.setattr("roxx.core.auth.db.AdminDatabase.get_role", lambda username: "auditor")
 
     forged_cookie = base64.b64encode(b"alice:active:superadmin").decode("utf-8")
     request = make_request(cookie_value=forged_cookie)
 
-    auth = get_auth_context(request)
+    assert get_auth_context(request) is None
+    assert "auth" not in request.session
 
-    assert auth == {"username": "alice", "status": "active", "role": "auditor"}
-    assert request.session["auth"]["role"] == "auditor"
+
+def test_get_auth_context_resolves_role_server_side(monkeypatch):
+    monkeypatch.setattr("roxx.core.auth.db.AdminDatabase.get_role", lambda username: "auditor")
+    request = make_request(session_auth={"username": "alice", "status": "active", "role": "superadmin"})
+
+    assert get_auth_context(request) == {"username": "alice", "status": "active", "role": "auditor"}
+
+
+def test_get_auth_context_resolves_role_once_per_request(monkeypatch):
+    lookups = []
+    monkeypatch.setattr("roxx.core.auth.db.AdminDatabase.get_role", lambda username: lookups.append(username) or "admin")
+    request = make_request(session_auth={"username": "alice", "status": "active"})
+
+    first = get_auth_context(request)
+    assert get_auth_context(request) is first
+    assert lookups == ["alice"]
+
+    set_auth_context(request, "bob", "active")
+    assert get_auth_context(request)["username"] == "bob"
+    request.session.clear()
+    assert get_auth_context(request) is None
 
 
 def test_require_action_denies_auditor_for_mutation(monkeypatch):
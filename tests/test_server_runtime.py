@@ -7,7 +7,7 @@ from roxx.cli.service import build_arg_parser, install_systemd_unit, render_syst
 from roxx.core.readiness import collect_readiness_checks
 from roxx.core.security.profiles import SecurityProfile
 from roxx.server.logging import configure_service_logging
-from roxx.server.runtime import ServerRuntimeConfig, build_uvicorn_config
+from roxx.server.runtime import ServerRuntimeConfig, build_uvicorn_config, run_web_server
 
 
 def test_server_runtime_config_from_env(monkeypatch):
@@ -20,6 +20,9 @@ def test_server_runtime_config_from_env(monkeypatch):
     monkeypatch.setenv("ROXX_BACKLOG", "1024")
     monkeypatch.setenv("ROXX_LIMIT_CONCURRENCY", "200")
     monkeypatch.setenv("ROXX_CLIENT_CERT_MODE", "required")
+    monkeypatch.setenv("ROXX_LOOP", "asyncio")
+    monkeypatch.setenv("ROXX_HTTP", "h11")
+    monkeypatch.setenv("ROXX_WORKERS", "4")
 
     config = ServerRuntimeConfig.from_env()
 
@@ -32,6 +35,9 @@ def test_server_runtime_config_from_env(monkeypatch):
     assert config.backlog == 1024
     assert config.limit_concurrency == 200
     assert config.client_cert_mode == "required"
+    assert config.loop == "asyncio"
+    assert config.http == "h11"
+    assert config.workers == 4
 
 
 def test_build_uvicorn_config_uses_explicit_cert_paths(monkeypatch, tmp_path):
@@ -59,6 +65,23 @@ def test_build_uvicorn_config_uses_explicit_cert_paths(monkeypatch, tmp_path):
     assert uvicorn_config.ssl_cert_reqs == 2
 
 
+def test_build_uvicorn_config_prefers_uvloop_and_httptools(tmp_path):
+    pytest.importorskip("uvloop")
+    pytest.importorskip("httptools")
+    config = ServerRuntimeConfig(
+        ssl_required=False,
+        auto_generate_cert=False,
+        ssl_certfile=str(tmp_path / "missing.crt"),
+        ssl_keyfile=str(tmp_path / "missing.key"),
+    )
+
+    uvicorn_config = build_uvicorn_config(config)
+
+    assert uvicorn_config.loop == "uvloop"
+    assert uvicorn_config.http == "httptools"
+    assert uvicorn_config.workers == 1
+
+
 def test_render_systemd_unit_contains_restart_policy():
     unit = render_systemd_unit(
         binary_path=Path("/opt/roxx/roxx"),
@@ -113,6 +136,13 @@ def test_production_runtime_requires_tls(monkeypatch):
         ServerRuntimeConfig.from_env()
 
 
+def test_multiple_workers_require_shared_secret_key(monkeypatch):
+    monkeypatch.delenv("ROXX_SECRET_KEY", raising=False)
+
+    with pytest.raises(RuntimeError, match="ROXX_SECRET_KEY"):
+        run_web_server(ServerRuntimeConfig(workers=2))
+
+
 def test_readiness_tcp_targets_do_not_expose_addresses(monkeypatch, tmp_path):
     monkeypatch.setenv("ROXX_CONFIG_DIR", str(tmp_path / "config"))
     monkeypatch.setenv("ROXX_DATA_DIR", str(tmp_path / "data"))
@@ -2,7 +2,9 @@
 Unit tests for ServiceManager
 """
 
-from unittest.mock import Mock, patch
+import asyncio
+import subprocess
+from unittest.mock import AsyncMock, Mock, patch
 
 from roxx.core.services import ServiceManager, ServiceStatus
 
@@ -46,6 +48,8 @@ class TestServiceManager:
         mock_run.return_value = Mock(returncode=0)
         result = mgr.start('freeradius')
         assert result is True
+        # Only the exit status matters: output is discarded, not piped
+        assert mock_run.call_args.kwargs['stdout'] is subprocess.DEVNULL
         
         mock_run.side_effect = Exception("Failed")
         result = mgr.start('freeradius')
@@ -79,3 +83,43 @@ class TestServiceManager:
         assert isinstance(statuses, dict)
         assert 'freeradius' in statuses
         assert all(isinstance(s, ServiceStatus) for s in statuses.values())
+
+    @patch('subprocess.run')
+    def test_get_all_services_status_single_systemctl_call(self, mock_run):
+        """Test every unit is probed by one systemctl invocation"""
+        mgr = ServiceManager()
+
+        mock_run.return_value = Mock(returncode=0, stdout="active\ninactive\nfailed\nactive\n")
+        statuses = mgr.get_all_services_status()
+
+        assert mock_run.call_count == 1
+        assert mock_run.call_args.args[0] == ['systemctl', 'is-active', *mgr.SERVICES.values()]
+        assert statuses == {
+            'freeradius': ServiceStatus.RUNNING,
+            'winbind': ServiceStatus.STOPPED,
+            'smbd': ServiceStatus.STOPPED,
+            'nmbd': ServiceStatus.RUNNING,
+        }
+
+    @patch('asyncio.create_subprocess_exec')
+    def test_get_status_async(self, mock_exec):
+        """Test non-blocking status check"""
+        mgr = ServiceManager()
+
+        mock_exec.return_value = Mock(wait=AsyncMock(return_value=0))
+        assert asyncio.run(mgr.get_status_async('freeradius')) == ServiceStatus.RUNNING
+        assert mock_exec.call_args.args == ('systemctl', 'is-active', 'freeradius')
+
+        mock_exec.return_value = Mock(wait=AsyncMock(return_value=3))
+        assert asyncio.run(mgr.get_status_async('freeradius')) == ServiceStatus.STOPPED
+
+    @patch('asyncio.create_subprocess_exec')
+    def test_get_all_services_status_async(self, mock_exec):
+        """Test concurrent status fan-out"""
+        mgr = ServiceManager()
+
+        mock_exec.return_value = Mock(wait=AsyncMock(return_value=0))
+        statuses = asyncio.run(mgr.get_all_services_status_async())
+
+        assert list(statuses) == list(mgr.SERVICES)
+        assert all(s == ServiceStatus.RUNNING for s in statuses.values())
@@ -17,12 +17,27 @@ class TestSystemManager:
         # SystemManager returns detailed OS name like "Ubuntu 24.04.3 LTS" not just "linux"
         assert isinstance(os_type, str)
         assert len(os_type) > 0
+
+    def test_get_os_release_field(self):
+        """Test os-release field lookup"""
+        assert SystemManager.get_os_release_field("ROXX_NO_SUCH_FIELD") is None
+        assert SystemManager.get_os_release_field("ROXX_NO_SUCH_FIELD", "x") == "x"
+        if Path("/etc/os-release").exists():
+            assert SystemManager.get_os_release_field("ID")
     
     def test_is_admin(self):
         """Test admin detection"""
         result = SystemManager.is_admin()
         assert isinstance(result, bool)
     
+    def test_is_service_running_any_name(self):
+        """Test several service names are matched in one pass"""
+        import psutil
+        # Our own process name ("python", "pytest", ...), within the 15-char comm limit
+        own_name = psutil.Process().name()[:15]
+        assert SystemManager.is_service_running("roxx-no-such-daemon", own_name)
+        assert not SystemManager.is_service_running("roxx-no-such-daemon", "roxx-missing")
+    
     def test_get_config_dir(self):
         """Test config directory path"""
         config_dir = SystemManager.get_config_dir()
@@ -36,6 +51,21 @@ class TestSystemManager:
 
 
     
+    def test_get_config_dir_follows_env(self, tmp_path, monkeypatch):
+        """Test that the cached config dir still honours ROXX_CONFIG_DIR changes"""
+        monkeypatch.setenv('ROXX_CONFIG_DIR', str(tmp_path / 'a'))
+        assert SystemManager.get_config_dir() == tmp_path / 'a'
+        
+        monkeypatch.setenv('ROXX_CONFIG_DIR', str(tmp_path / 'b'))
+        assert SystemManager.get_config_dir() == tmp_path / 'b'
+        
+        monkeypatch.delenv('ROXX_CONFIG_DIR')
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / 'config').mkdir()
+        SystemManager.clear_dir_cache()
+        assert SystemManager.get_config_dir() == (tmp_path / 'config').absolute()
+        SystemManager.clear_dir_cache()
+    
     def test_get_data_dir(self):
         """Test data directory path"""
         data_dir = SystemManager.get_data_dir()
@@ -63,6 +93,13 @@ class TestSystemManager:
         """Test failed command execution"""
         with pytest.raises(Exception):
             SystemManager.run_command(['nonexistent_command_xyz'], check=True)
+
+    def test_run_command_discard_output(self):
+        """Test running a command without capturing its output"""
+        result = SystemManager.run_command(['echo', 'test'], discard_output=True)
+        
+        assert result.returncode == 0
+        assert result.stdout is None
     
     def test_ensure_directories(self, tmp_path, monkeypatch):
         """Test directory creation"""
@@ -76,3 +113,43 @@ class TestSystemManager:
         assert (tmp_path / 'config').exists()
         assert (tmp_path / 'data').exists()
         assert (tmp_path / 'logs').exists()
+    
+    def test_add_and_delete_radius_user(self, tmp_path, monkeypatch):
+        """Test users.conf rewrites replace, keep and remove the right lines"""
+        monkeypatch.setattr(SystemManager, 'get_config_dir', lambda: tmp_path)
+        users_file = tmp_path / 'users.conf'
+        users_file.write_text('# header\nalice Cleartext-Password := "old"\nalicia Cleartext-Password := "x"')
+        
+        assert SystemManager.add_radius_user('alice', 'new') is True
+        assert users_file.read_text() == (
+            '# header\nalicia Cleartext-Password := "x"\nalice Cleartext-Password := "new"\n'
+        )
+        
+        assert SystemManager.delete_radius_user('alice') is True
+        assert users_file.read_text() == '# header\nalicia Cleartext-Password := "x"\n'
+        assert [p.name for p in tmp_path.iterdir()] == ['users.conf']
+
+    def test_delete_radius_user_keeps_bytes(self, tmp_path, monkeypatch):
+        """Test deletion handles indented, CRLF and unterminated lines byte-for-byte"""
+        monkeypatch.setattr(SystemManager, 'get_config_dir', lambda: tmp_path)
+        users_file = tmp_path / 'users.conf'
+        users_file.write_bytes(b'bob X := "1"\r\n  alice X := "2"\r\nalice.b X := "3"\r\nalice X := "4"')
+        
+        assert SystemManager.delete_radius_user('alice') is True
+        assert users_file.read_bytes() == b'bob X := "1"\r\nalice.b X := "3"\r\n'
+        
+        users_file.write_bytes(b'')
+        assert SystemManager.delete_radius_user('alice') is True
+        assert users_file.read_bytes() == b''
+
+    def test_radius_user_missing_file(self, tmp_path, monkeypatch):
+        """Test delete on a missing users.conf and add into a missing directory"""
+        config_dir = tmp_path / 'nested' / 'config'
+        monkeypatch.setattr(SystemManager, 'get_config_dir', lambda: config_dir)
+        
+        assert SystemManager.delete_radius_user('alice') is False
+        assert not config_dir.exists()
+        
+        assert SystemManager.add_radius_user('alice', 'pw') is True
+        assert (config_dir / 'users.conf').read_text() == 'alice Cleartext-Password := "pw"\n'
+        assert SystemManager.delete_radius_user('bob') is True
@@ -2,9 +2,13 @@
 Unit tests for TOTP Authenticator
 """
 
+import hashlib
+import hmac
 import pytest
 import time
+from collections import OrderedDict
 
+import roxx.core.auth.totp as totp_module
 from roxx.core.auth.totp import TOTPAuthenticator
 
 
@@ -53,6 +57,44 @@ class TestTOTPAuthenticator:
         # Should still be valid with window=1
         assert totp.verify(past_code, window=1) is True
     
+    def test_verify_reuses_window_codes(self, monkeypatch):
+        """Test repeat verifications in one period skip the HMACs"""
+        totp = TOTPAuthenticator(secret="JBSWY3DPEHPK3PXP")
+        now = 1_700_000_000
+        code = totp.generate(now)
+        assert totp.verify(code, timestamp=now) is True
+        
+        calls = []
+        monkeypatch.setattr(totp, "generate", lambda ts=None: calls.append(ts) or "")
+        assert totp.verify(code, timestamp=now + 1) is True
+        assert totp.verify("12345", timestamp=now) is False
+        assert calls == []
+        
+        # The next period recomputes the window
+        totp.verify(code, timestamp=now + 30)
+        assert len(calls) == 3
+    
+    def test_window_cache_hides_secrets_and_evicts_lru(self, monkeypatch):
+        """Test the window cache keys on a digest and drops the least recent entry"""
+        monkeypatch.setattr(totp_module, "_WINDOW_CACHE_SIZE", 2)
+        monkeypatch.setattr(totp_module, "_window_cache", OrderedDict())
+        now = 1_700_000_000
+        first, second, third = (
+            TOTPAuthenticator(secret=s) for s in ("JBSWY3DPEHPK3PXP", "GEZDGNBVGY3TQOJQ", "MFRGGZDFMZTWQ2LK")
+        )
+        first.verify("000000", timestamp=now)
+        second.verify("000000", timestamp=now)
+        first.verify("000000", timestamp=now)
+        third.verify("000000", timestamp=now)
+        
+        def digest(totp):
+            return hmac.new(totp_module._WINDOW_CACHE_KEY, totp.secret.encode(), hashlib.sha256).digest()
+        
+        cache = totp_module._window_cache
+        assert all(first.secret not in key for key in cache)
+        # second was the least recently used entry, so it was evicted
+        assert [key[0] for key in cache] == [digest(first), digest(third)]
+    
     def test_different_algorithms(self):
         """Test TOTP with different hash algorithms"""
         secret = "JBSWY3DPEHPK3PXP"
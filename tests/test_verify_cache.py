@@ -0,0 +1,42 @@
+import bcrypt
+
+from roxx.core.auth.verify_cache import VerifyCache
+
+
+def test_verify_cache_skips_repeat_kdf_and_tracks_hash_changes():
+    cache = VerifyCache(max_entries=2, ttl=60)
+    calls = []
+
+    def verify(password, stored_hash):
+        calls.append(password)
+        return bcrypt.checkpw(password, stored_hash)
+
+    old_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt(4))
+    assert cache.check(old_hash, b"secret", verify) is True
+    assert cache.check(old_hash, b"secret", verify) is True
+    assert cache.check(old_hash, b"wrong", verify) is False
+    assert cache.check(old_hash, b"wrong", verify) is False
+    assert calls == [b"secret", b"wrong"]
+
+    # A changed password produces a new stored hash, so old entries never match
+    new_hash = bcrypt.hashpw(b"rotated", bcrypt.gensalt(4))
+    assert cache.check(new_hash, b"secret", verify) is False
+    assert len(calls) == 3
+
+
+def test_verify_cache_expires_and_evicts():
+    cache = VerifyCache(max_entries=1, ttl=0)
+    calls = []
+
+    def verify(password, stored_hash):
+        calls.append(password)
+        return True
+
+    cache.check(b"h", b"a", verify)
+    cache.check(b"h", b"a", verify)
+    assert len(calls) == 2
+
+    cache.ttl = 60
+    cache.check(b"h", b"a", verify)
+    cache.check(b"h", b"b", verify)
+    assert len(cache._entries) == 1